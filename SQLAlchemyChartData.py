@@ -7,26 +7,59 @@ from datetime import datetime, timedelta
 from collections import Counter
 
 from sqlalchemy import (create_engine, Column, Integer, String, DateTime,
-                        Boolean, func, ForeignKey)
+                        Boolean, func, ForeignKey, insert, text)
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, relationship
-from sqlalchemy.exc import SQLAlchemyError, OperationalError
+from sqlalchemy.exc import (IntegrityError, OperationalError,
+                            ProgrammingError, SQLAlchemyError)
 
 from wordcloud import STOPWORDS  # Import STOPWORDS to filter common terms
 
 import logging
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s [%(levelname)s] %(message)s',
-    handlers=[logging.FileHandler("app.log"),
-              logging.StreamHandler()])
+# Handlers are configured by the application entry point (main.py)
 logger = logging.getLogger(__name__)
 
 # Create a base class for declarative class definitions
 Base = declarative_base()
 
+# All dashboard aggregations in a single round-trip (PostgreSQL only).
+# Mirrors the individual get_* methods below.
+ALL_METRICS_SQL = text("""
+WITH lang AS (
+    SELECT language, count(*) AS c FROM searches GROUP BY language
+), totals AS (
+    SELECT count(*) AS total,
+           count(*) FILTER (WHERE led_to_concept_lookup) AS lookups
+    FROM searches
+), trend AS (
+    SELECT to_char(date("timestamp"), 'YYYY-MM-DD') AS d, count(*) AS c
+    FROM searches WHERE "timestamp" >= :trend_start GROUP BY 1
+), terms AS (
+    SELECT lower(term) AS t, count(*) AS c
+    FROM searches WHERE lower(term) <> ALL(:stopwords)
+    GROUP BY 1 ORDER BY c DESC LIMIT :terms_limit
+), viewed AS (
+    SELECT concept, count(*) AS c
+    FROM viewed_concepts GROUP BY concept ORDER BY c DESC LIMIT :top_limit
+), selected AS (
+    SELECT synonym, count(*) AS c
+    FROM selected_synonyms GROUP BY synonym ORDER BY c DESC LIMIT :top_limit
+)
+SELECT
+    (SELECT json_object_agg(language, c) FROM lang) AS language_distribution,
+    (SELECT total FROM totals) AS total_searches,
+    (SELECT lookups FROM totals) AS concept_lookups,
+    (SELECT json_agg(json_build_array(d, c) ORDER BY d) FROM trend)
+        AS search_trend,
+    (SELECT json_agg(json_build_array(t, c) ORDER BY c DESC) FROM terms)
+        AS common_search_terms,
+    (SELECT json_agg(json_build_array(concept, c) ORDER BY c DESC) FROM viewed)
+        AS most_viewed_concepts,
+    (SELECT json_agg(json_build_array(synonym, c) ORDER BY c DESC)
+        FROM selected) AS most_selected_synonyms
+""")
+
 # Define the initial languages
 INITIAL_LANGUAGES = [
     {
@@ -180,7 +213,11 @@ class SQLAlchemyChartData:
                                     pool_timeout=30,
                                     pool_recycle=1800,
                                     pool_pre_ping=True)
-        Base.metadata.create_all(self.engine)
+        try:
+            Base.metadata.create_all(self.engine)
+        except (IntegrityError, ProgrammingError):
+            # Another worker process created the tables concurrently
+            Base.metadata.create_all(self.engine)
         self.Session = sessionmaker(bind=self.engine)
 
         # Seed initial languages
@@ -228,6 +265,8 @@ class SQLAlchemyChartData:
     def seed_initial_languages(self):
         """
         Seeds the database with initial languages if they don't already exist.
+        Safe to run from several worker processes at once: whichever loses the
+        race on the unique code column leaves the seeding to the winner.
         """
         with self.Session() as session:
             try:
@@ -250,6 +289,9 @@ class SQLAlchemyChartData:
                     )
                 else:
                     logger.info("Initial languages already seeded.")
+            except IntegrityError:
+                session.rollback()
+                logger.info("Initial languages seeded by another worker.")
             except SQLAlchemyError as e:
                 session.rollback()
                 logger.error(f"Failed to seed initial languages: {e}")
@@ -315,6 +357,29 @@ class SQLAlchemyChartData:
                 logger.error(f"Failed to add selected synonym: {e}")
                 raise
 
+    @_handle_disconnects
+    def add_metric_events_bulk(self, searches: List[Dict],
+                               viewed_concepts: List[Dict]) -> None:
+        """
+        Inserts a batch of search records and viewed concepts in one transaction.
+        Rows are column dicts, e.g. {'language', 'term', 'led_to_concept_lookup',
+        'timestamp'} for searches and {'concept', 'timestamp'} for views.
+        """
+        with self.Session() as session:
+            try:
+                if searches:
+                    session.execute(insert(Search), searches)
+                if viewed_concepts:
+                    session.execute(insert(ViewedConcept), viewed_concepts)
+                session.commit()
+                logger.info(
+                    f"Added {len(searches)} searches and {len(viewed_concepts)} viewed concepts"
+                )
+            except SQLAlchemyError as e:
+                session.rollback()
+                logger.error(f"Failed to add metric events: {e}")
+                raise
+
     @_handle_disconnects
     def get_language_distribution(self) -> Dict[str, int]:
         """
@@ -453,6 +518,50 @@ class SQLAlchemyChartData:
                 logger.error(f"Failed to retrieve most selected synonyms: {e}")
                 return {}
 
+    def supports_one_shot_metrics(self) -> bool:
+        """
+        Whether get_all_metrics_one_shot can run on the configured database.
+        """
+        return self.engine.dialect.name == "postgresql"
+
+    @_handle_disconnects
+    def get_all_metrics_one_shot(self,
+                                 days: int = 30,
+                                 terms_limit: int = 50,
+                                 top_limit: int = 10) -> Dict:
+        """
+        Retrieves every dashboard metric with a single CTE query.
+        Returns a dict keyed like the individual get_* methods.
+        """
+        with self.Session() as session:
+            try:
+                row = session.execute(
+                    ALL_METRICS_SQL, {
+                        "trend_start": datetime.utcnow() - timedelta(days=days),
+                        "stopwords": list(STOPWORDS),
+                        "terms_limit": terms_limit,
+                        "top_limit": top_limit
+                    }).one()
+                total_searches = row.total_searches or 0
+                concept_lookup_percentage = (
+                    (row.concept_lookups or 0) / total_searches *
+                    100 if total_searches else 0.0)
+                logger.info("Retrieved all metrics in one query")
+                return {
+                    'language_distribution': row.language_distribution or {},
+                    'total_searches': total_searches,
+                    'search_trend': [(d, c) for d, c in row.search_trend or []],
+                    'common_search_terms': dict(row.common_search_terms or []),
+                    'concept_lookup_percentage': concept_lookup_percentage,
+                    'most_viewed_concepts': dict(row.most_viewed_concepts
+                                                 or []),
+                    'most_selected_synonyms': dict(row.most_selected_synonyms
+                                                   or [])
+                }
+            except SQLAlchemyError as e:
+                logger.error(f"Failed to retrieve all metrics: {e}")
+                raise
+
     @_handle_disconnects
     def get_search_paths(self) -> List[Dict]:
         """
@@ -500,6 +609,29 @@ class SQLAlchemyChartData:
                 logger.error(f"Failed to add new language: {e}")
                 raise
 
+    @_handle_disconnects
+    def add_languages_bulk(self, languages: List[Dict[str, str]]) -> None:
+        """
+        Adds several languages to the database in a single transaction.
+        Each entry needs 'name', 'code' and 'native_name' keys.
+        """
+        with self.Session() as session:
+            try:
+                session.add_all([
+                    Language(name=lang['name'],
+                             code=lang['code'].lower(),
+                             native_name=lang['native_name'])
+                    for lang in languages
+                ])
+                session.commit()
+                logger.info(
+                    f"Added new languages: {[lang['code'] for lang in languages]}"
+                )
+            except SQLAlchemyError as e:
+                session.rollback()
+                logger.error(f"Failed to add new languages: {e}")
+                raise
+
     @_handle_disconnects
     def get_language_by_code(self, code: str) -> Union[Language, None]:
         """
@@ -39,7 +39,8 @@ class AthenaOHDSIAPI:
                  retries: int = 3,
                  backoff_factor: float = 0.3,
                  status_forcelist: list = [500, 502, 503, 504],
-                 session_timeout: Optional[int] = None):  # noqa: ARG002
+                 session_timeout: Optional[int] = 10,
+                 pool_maxsize: int = 50):
         """
         Initializes the API client with enhanced configurations.
 
@@ -48,16 +49,16 @@ class AthenaOHDSIAPI:
         :param retries: Total number of retry attempts for transient errors.
         :param backoff_factor: A backoff factor to apply between attempts after the second try.
         :param status_forcelist: A set of HTTP status codes that we should force a retry on.
-        :param session_timeout: Timeout for API requests in seconds.
+        :param session_timeout: Timeout for API requests in seconds, so a
+                                stalled Athena response can't hang the
+                                calling thread. None waits indefinitely.
+        :param pool_maxsize: Keep-alive connections kept per host, so a shared
+                             client can serve concurrent threads without
+                             reconnecting.
         """
         self.base_url = base_url.rstrip('/')
+        self.timeout = session_timeout
         self.session = requests.Session()
-        self.session.mount(
-            'https://',
-            HTTPAdapter(
-                max_retries=Retry(total=3,
-                                  backoff_factor=0.3,
-                                  status_forcelist=[500, 502, 503, 504])))
 
         headers = {
             'Accept': 'application/json',
@@ -79,12 +80,13 @@ class AthenaOHDSIAPI:
                                backoff_factor=backoff_factor,
                                status_forcelist=status_forcelist,
                                allowed_methods=["HEAD", "GET", "OPTIONS"])
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        adapter = HTTPAdapter(max_retries=retry_strategy,
+                              pool_maxsize=pool_maxsize)
         self.session.mount("https://", adapter)
         self.session.mount("http://", adapter)
 
         logger.debug(
-            f"AthenaOHDSIAPI initialized with base_url: {self.base_url}")
+            "AthenaOHDSIAPI initialized with base_url: %s", self.base_url)
 
     def get_medical_concepts(
             self,
@@ -121,13 +123,16 @@ class AthenaOHDSIAPI:
         if vocabulary is not None:
             params['vocabulary'] = vocabulary
 
-        logger.info(f"Fetching medical concepts with params: {params}")
+        logger.info("Fetching medical concepts with params: %s", params)
         try:
-            response = self.session.get(endpoint, params=params)
+            response = self.session.get(endpoint,
+                                        params=params,
+                                        timeout=self.timeout)
             response.raise_for_status()
-            data = response.json()
-            logger.debug(f"Medical Concepts Response JSON: {data}")
-            return MedicalConceptsResponse.parse_obj(data)
+            body = response.content
+            logger.debug("Medical Concepts Response JSON: %s", body)
+            # Validated from the raw bytes, without building dicts first
+            return MedicalConceptsResponse.model_validate_json(body)
         except requests.exceptions.Timeout:
             logger.error("Request timed out.")
             raise
@@ -136,13 +141,14 @@ class AthenaOHDSIAPI:
             raise
         except requests.exceptions.HTTPError as http_err:
             logger.error(
-                f"HTTP error occurred: {http_err} - Response: {response.text}")
+                "HTTP error occurred: %s - Response: %s", http_err,
+                response.text)
             raise
         except ValidationError as ve:
-            logger.error(f"Data validation error: {ve}")
+            logger.error("Data validation error: %s", ve)
             raise ValueError(f"Invalid response structure: {ve}")
         except Exception as e:
-            logger.error(f"An unexpected error occurred: {e}")
+            logger.error("An unexpected error occurred: %s", e)
             raise
 
     def get_concept_relationships(self,
@@ -156,13 +162,13 @@ class AthenaOHDSIAPI:
                  ValueError for data validation errors.
         """
         endpoint = f"{self.base_url}/concepts/{concept_id}/relationships"
-        logger.info(f"Fetching relationships for Concept ID: {concept_id}")
+        logger.info("Fetching relationships for Concept ID: %s", concept_id)
         try:
-            response = self.session.get(endpoint)
+            response = self.session.get(endpoint, timeout=self.timeout)
             response.raise_for_status()
-            data = response.json()
-            logger.debug(f"Concept Relationships Response JSON: {data}")
-            return ConceptRelationship.parse_obj(data)
+            body = response.content
+            logger.debug("Concept Relationships Response JSON: %s", body)
+            return ConceptRelationship.model_validate_json(body)
         except requests.exceptions.Timeout:
             logger.error("Request timed out.")
             raise
@@ -171,13 +177,14 @@ class AthenaOHDSIAPI:
             raise
         except requests.exceptions.HTTPError as http_err:
             logger.error(
-                f"HTTP error occurred: {http_err} - Response: {response.text}")
+                "HTTP error occurred: %s - Response: %s", http_err,
+                response.text)
             raise
         except ValidationError as ve:
-            logger.error(f"Data validation error: {ve}")
+            logger.error("Data validation error: %s", ve)
             raise ValueError(f"Invalid response structure: {ve}")
         except Exception as e:
-            logger.error(f"An unexpected error occurred: {e}")
+            logger.error("An unexpected error occurred: %s", e)
             raise
 
     def close(self):
@@ -35,16 +35,22 @@ class AsyncAthenaOHDSIAPI:
     def __init__(self,
                  base_url: str = "https://athena.ohdsi.org/api/v1",
                  api_key: Optional[str] = None,
-                 timeout: int = 10):
+                 timeout: int = 10,
+                 max_connections: int = 64):
         """
         Initializes the asynchronous API client.
+        A single aiohttp session (and its keep-alive connection pool) is shared
+        by every request made through this client; call close() when done.
 
         :param base_url: The base URL for the Athena OHDSI API.
         :param api_key: Optional API key for authentication.
         :param timeout: Timeout for API requests in seconds.
+        :param max_connections: Size of the pooled connection limit.
         """
         self.base_url = base_url.rstrip('/')
         self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self.max_connections = max_connections
+        self._session: Optional[aiohttp.ClientSession] = None
         self.headers = {
             'Accept': 'application/json',
             'Content-Type': 'application/json',
@@ -57,6 +63,20 @@ class AsyncAthenaOHDSIAPI:
             logger.info(
                 "No API key provided; Authorization header will not be set.")
 
+    def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Returns the pooled session, creating it on first use (it must be created
+        inside a running event loop).
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                headers=self.headers,
+                timeout=self.timeout,
+                connector=aiohttp.TCPConnector(limit=self.max_connections,
+                                               ttl_dns_cache=300,
+                                               keepalive_timeout=60))
+        return self._session
+
     async def get_medical_concepts(
             self,
             query: str,
@@ -91,36 +111,36 @@ class AsyncAthenaOHDSIAPI:
         if vocabulary is not None:
             params['vocabulary'] = vocabulary
 
-        logger.info(
-            f"Fetching medical concepts asynchronously with params: {params}")
-        async with aiohttp.ClientSession(headers=self.headers,
-                                         timeout=self.timeout) as session:
-            try:
-                async with session.get(endpoint, params=params) as response:
-                    response.raise_for_status()
-                    data = await response.json()
-                    logger.debug(f"Medical Concepts Response JSON: {data}")
-                    return MedicalConceptsResponse.model_validate(data)
-            except aiohttp.ClientResponseError as http_err:
-                # Ensure response is checked for valid text response
-                response_text = await response.text(
-                ) if response is not None else 'No response'
-                logger.error(
-                    f"HTTP error occurred: {http_err} - Response: {response_text}"
-                )
-                raise
-            except asyncio.TimeoutError:
-                logger.error("Request timed out.")
-                raise
-            except aiohttp.ClientError as conn_err:
-                logger.error(f"Connection error occurred: {conn_err}")
-                raise
-            except ValidationError as ve:
-                logger.error(f"Data validation error: {ve}")
-                raise ValueError(f"Invalid response structure: {ve}")
-            except Exception as e:
-                logger.error(f"An unexpected error occurred: {e}")
-                raise
+        logger.info("Fetching medical concepts asynchronously with params: %s",
+                    params)
+        session = self._get_session()
+        try:
+            async with session.get(endpoint, params=params) as response:
+                response.raise_for_status()
+                body = await response.read()
+                logger.debug("Medical Concepts Response JSON: %s", body)
+                # Validated from the raw bytes, without building dicts first
+                return MedicalConceptsResponse.model_validate_json(body)
+        except aiohttp.ClientResponseError as http_err:
+            # Ensure response is checked for valid text response
+            response_text = await response.text(
+            ) if response is not None else 'No response'
+            logger.error(
+                "HTTP error occurred: %s - Response: %s", http_err,
+                response_text)
+            raise
+        except asyncio.TimeoutError:
+            logger.error("Request timed out.")
+            raise
+        except aiohttp.ClientError as conn_err:
+            logger.error("Connection error occurred: %s", conn_err)
+            raise
+        except ValidationError as ve:
+            logger.error("Data validation error: %s", ve)
+            raise ValueError(f"Invalid response structure: {ve}")
+        except Exception as e:
+            logger.error("An unexpected error occurred: %s", e)
+            raise
 
     async def get_concept_relationships(
             self, concept_id: int) -> ConceptRelationship:
@@ -132,39 +152,37 @@ class AsyncAthenaOHDSIAPI:
         :raises: HTTP-related errors and ValidationError for data issues.
         """
         endpoint = f"{self.base_url}/concepts/{concept_id}/relationships"
-        logger.info(
-            f"Fetching relationships for Concept ID: {concept_id} asynchronously"
-        )
-        async with aiohttp.ClientSession(headers=self.headers,
-                                         timeout=self.timeout) as session:
-            try:
-                async with session.get(endpoint) as response:
-                    response.raise_for_status()
-                    data = await response.json()
-                    logger.debug(
-                        f"Concept Relationships Response JSON: {data}")
-                    return ConceptRelationship.parse_obj(data)
-            except aiohttp.ClientResponseError as http_err:
-                logger.error(
-                    f"HTTP error occurred: {http_err} - Response: {await response.text()}"
-                )
-                raise
-            except asyncio.TimeoutError:
-                logger.error("Request timed out.")
-                raise
-            except aiohttp.ClientError as conn_err:
-                logger.error(f"Connection error occurred: {conn_err}")
-                raise
-            except ValidationError as ve:
-                logger.error(f"Data validation error: {ve}")
-                raise ValueError(f"Invalid response structure: {ve}")
-            except Exception as e:
-                logger.error(f"An unexpected error occurred: {e}")
-                raise
+        logger.info("Fetching relationships for Concept ID: %s asynchronously",
+                    concept_id)
+        session = self._get_session()
+        try:
+            async with session.get(endpoint) as response:
+                response.raise_for_status()
+                body = await response.read()
+                logger.debug("Concept Relationships Response JSON: %s", body)
+                return ConceptRelationship.model_validate_json(body)
+        except aiohttp.ClientResponseError as http_err:
+            logger.error(
+                "HTTP error occurred: %s - Response: %s", http_err,
+                await response.text())
+            raise
+        except asyncio.TimeoutError:
+            logger.error("Request timed out.")
+            raise
+        except aiohttp.ClientError as conn_err:
+            logger.error("Connection error occurred: %s", conn_err)
+            raise
+        except ValidationError as ve:
+            logger.error("Data validation error: %s", ve)
+            raise ValueError(f"Invalid response structure: {ve}")
+        except Exception as e:
+            logger.error("An unexpected error occurred: %s", e)
+            raise
 
     async def close(self):
         """
-        Placeholder for any cleanup if necessary in the future.
-        Currently, aiohttp sessions are managed using context managers.
+        Closes the pooled session and its connections.
         """
-        logger.info("AsyncAthenaOHDSIAPI client cleanup (if necessary).")
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        logger.info("AsyncAthenaOHDSIAPI client closed.")
@@ -40,3 +40,5 @@ class MedicalConceptsResponse(BaseModel):
     numberOfElements: int
     empty: bool
     content: List[Concept]
+    totalPages: Optional[int] = None
+    totalElements: Optional[int] = None
@@ -0,0 +1,185 @@
+# batch_runner.py
+"""
+Runs ell LMPs over many inputs as OpenAI Batch API jobs.
+Batch jobs cost about half as much as regular calls and don't count against
+the per-minute rate limits, but may take up to 24h, so this is meant for
+offline bulk work (prefilling synonyms, disambiguating a vocabulary dump,
+looking up a term list), not for request handling.
+
+Example:
+    results = asyncio.run(
+        run_batch(generate_synonyms, [(term, "en", "cardiology")
+                                      for term in terms]))
+    concepts = asyncio.run(run_concept_lookup_batch(terms, "cardiology", "es"))
+"""
+
+import asyncio
+import logging
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from openai import pydantic_function_tool
+
+from openai_batch import run_chat_batch, to_jsonl
+from workflow import (
+    CONCEPT_LOOKUP_MAX_ROWS,
+    TRANSLATE_MODEL,
+    ConceptResponse,
+    _concept_lookup_messages,
+    _get_async_openai,
+    _has_concepts,
+    _is_english,
+    _to_openai_messages,
+    afind_omop_concept,
+    batch_concept_lookup,
+    concept_lookup,
+    translate,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _response_format(model: type) -> dict:
+    """
+    Returns the strict json_schema response_format for a pydantic model, as
+    the structured LMPs send it. The strict schema comes from the public
+    function tool helper, which applies the same conversion.
+    """
+    function = pydantic_function_tool(model)["function"]
+    return {
+        "type": "json_schema",
+        "json_schema": {
+            "name": function["name"],
+            "schema": function["parameters"],
+            "strict": True,
+        },
+    }
+
+
+def _request_body(messages, api_params: Dict[str, Any], model: str,
+                  max_completion_tokens: Optional[int]) -> dict:
+    """
+    Builds a chat completions request body from ell messages and the API
+    params an LMP was decorated with.
+    """
+    body = {"model": model, "messages": _to_openai_messages(messages)}
+    for name, value in api_params.items():
+        if name == "response_format" and isinstance(value, type):
+            value = _response_format(value)
+        body[name] = value
+    if max_completion_tokens is not None:
+        body.pop("max_tokens", None)
+        body["max_completion_tokens"] = max_completion_tokens
+    return body
+
+
+def _request_bodies(lmp, args_list: Sequence[Tuple], model: str,
+                    max_completion_tokens: Optional[int]) -> List[dict]:
+    """
+    Returns the request bodies for calling lmp once per argument tuple.
+    """
+    return [
+        _request_body(lmp.__ell_func__(*args), lmp.__ell_api_params__, model,
+                      max_completion_tokens) for args in args_list
+    ]
+
+
+def build_batch_jsonl(lmp,
+                      args_list: Sequence[Tuple],
+                      model: str = "gpt-4o-mini",
+                      max_completion_tokens: Optional[int] = None) -> bytes:
+    """
+    Returns the Batch API input file for calling lmp once per argument tuple.
+    Each request's custom_id is its index in args_list.
+    """
+    return to_jsonl(
+        _request_bodies(lmp, args_list, model, max_completion_tokens))
+
+
+def _parser(api_params: Dict[str, Any]) -> Callable[[str], Any]:
+    """
+    Returns how to parse a completion the way the async LMP variants do:
+    structured LMPs give their response model, the others the raw text.
+    """
+    response_format = api_params.get("response_format")
+    if isinstance(response_format, type):
+        return response_format.model_validate_json
+    return lambda content: content
+
+
+async def _run_bodies(bodies: Sequence[dict],
+                      parse: Callable[[str], Any]) -> List[Optional[Any]]:
+    """
+    Runs the request bodies as one Batch API job and returns the parsed
+    results in order. Requests the job failed to answer, or whose answer
+    doesn't parse, are None.
+    """
+    results: List[Optional[Any]] = []
+    for i, content in enumerate(await run_chat_batch(_get_async_openai(),
+                                                     bodies)):
+        result = None
+        if content is not None:
+            try:
+                result = parse(content)
+            except ValueError as e:
+                logger.warning("Skipping unparsable batch result %d: %s", i,
+                               e)
+        results.append(result)
+    return results
+
+
+async def run_batch(lmp,
+                    args_list: Sequence[Tuple],
+                    model: str = "gpt-4o-mini",
+                    max_completion_tokens: Optional[int] = None
+                    ) -> List[Optional[Any]]:
+    """
+    Submits one Batch API job calling lmp for every argument tuple, waits for
+    it to finish and returns the results in the same order as args_list.
+    Requests the job failed to answer are None.
+    """
+    return await _run_bodies(
+        _request_bodies(lmp, args_list, model, max_completion_tokens),
+        _parser(lmp.__ell_api_params__))
+
+
+async def run_concept_lookup_batch(terms: Sequence[str],
+                                   context: str,
+                                   language: str = "en"
+                                   ) -> List[Optional[ConceptResponse]]:
+    """
+    Batch counterpart of aconcept_lookup for a list of terms. Translations
+    and the concept lookup LMP each run as one Batch API job; the Athena
+    searches in between run concurrently.
+    Returns the responses in the same order as terms, None where the job
+    failed to answer.
+    """
+    if _is_english(language):
+        # English lookups make no LLM calls, so there is nothing to batch
+        return await batch_concept_lookup(list(terms), context, language)
+
+    translations = await run_batch(translate, [(term, context, "english")
+                                               for term in terms],
+                                   model=TRANSLATE_MODEL)
+    # Search with the untranslated term where the translation is missing
+    search_terms = [
+        translated or term
+        for term, translated in zip(terms, translations, strict=True)
+    ]
+
+    concepts_jsons = await asyncio.gather(
+        *(afind_omop_concept(term, language, max_rows=CONCEPT_LOOKUP_MAX_ROWS)
+          for term in search_terms))
+    # Searches that failed or found nothing get an empty response without
+    # going through the job
+    found = [i for i, c in enumerate(concepts_jsons) if _has_concepts(c)]
+    answers = await _run_bodies([
+        _request_body(_concept_lookup_messages(concepts_jsons[i], language),
+                      concept_lookup.__ell_api_params__, "gpt-4o-mini", None)
+        for i in found
+    ], _parser(concept_lookup.__ell_api_params__))
+    results: List[Optional[ConceptResponse]] = [
+        ConceptResponse(concepts=[]) for _ in terms
+    ]
+    for i, answer in zip(found, answers, strict=True):
+        results[i] = answer
+    return results
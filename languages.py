@@ -0,0 +1,178 @@
+# languages.py
+"""
+Static ISO 639-1 language table, so resolving a language name, code or
+native name doesn't need an LLM call for the common cases.
+"""
+
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
+# (ISO 639-1 code, English name, native name)
+ISO_LANGUAGES: Tuple[Tuple[str, str, str], ...] = (
+    ("af", "Afrikaans", "Afrikaans"),
+    ("am", "Amharic", "አማርኛ"),
+    ("ar", "Arabic", "العربية"),
+    ("as", "Assamese", "অসমীয়া"),
+    ("az", "Azerbaijani", "Azərbaycan"),
+    ("be", "Belarusian", "Беларуская"),
+    ("bg", "Bulgarian", "Български"),
+    ("bn", "Bengali", "বাংলা"),
+    ("bo", "Tibetan", "བོད་ཡིག"),
+    ("br", "Breton", "Brezhoneg"),
+    ("bs", "Bosnian", "Bosanski"),
+    ("ca", "Catalan", "Català"),
+    ("cs", "Czech", "Čeština"),
+    ("cy", "Welsh", "Cymraeg"),
+    ("da", "Danish", "Dansk"),
+    ("de", "German", "Deutsch"),
+    ("el", "Greek", "Ελληνικά"),
+    ("en", "English", "English"),
+    ("eo", "Esperanto", "Esperanto"),
+    ("es", "Spanish", "Español"),
+    ("et", "Estonian", "Eesti"),
+    ("eu", "Basque", "Euskara"),
+    ("fa", "Persian", "فارسی"),
+    ("fi", "Finnish", "Suomi"),
+    ("fo", "Faroese", "Føroyskt"),
+    ("fr", "French", "Français"),
+    ("fy", "Western Frisian", "Frysk"),
+    ("ga", "Irish", "Gaeilge"),
+    ("gd", "Scottish Gaelic", "Gàidhlig"),
+    ("gl", "Galician", "Galego"),
+    ("gn", "Guarani", "Avañe'ẽ"),
+    ("gu", "Gujarati", "ગુજરાતી"),
+    ("ha", "Hausa", "Hausa"),
+    ("he", "Hebrew", "עברית"),
+    ("hi", "Hindi", "हिन्दी"),
+    ("hr", "Croatian", "Hrvatski"),
+    ("ht", "Haitian Creole", "Kreyòl ayisyen"),
+    ("hu", "Hungarian", "Magyar"),
+    ("hy", "Armenian", "Հայերեն"),
+    ("id", "Indonesian", "Bahasa Indonesia"),
+    ("ig", "Igbo", "Igbo"),
+    ("is", "Icelandic", "Íslenska"),
+    ("it", "Italian", "Italiano"),
+    ("ja", "Japanese", "日本語"),
+    ("jv", "Javanese", "Basa Jawa"),
+    ("ka", "Georgian", "ქართული"),
+    ("kk", "Kazakh", "Қазақ тілі"),
+    ("km", "Khmer", "ខ្មែរ"),
+    ("kn", "Kannada", "ಕನ್ನಡ"),
+    ("ko", "Korean", "한국어"),
+    ("ku", "Kurdish", "Kurdî"),
+    ("ky", "Kyrgyz", "Кыргызча"),
+    ("la", "Latin", "Latina"),
+    ("lb", "Luxembourgish", "Lëtzebuergesch"),
+    ("lo", "Lao", "ລາວ"),
+    ("lt", "Lithuanian", "Lietuvių"),
+    ("lv", "Latvian", "Latviešu"),
+    ("mg", "Malagasy", "Malagasy"),
+    ("mi", "Maori", "Māori"),
+    ("mk", "Macedonian", "Македонски"),
+    ("ml", "Malayalam", "മലയാളം"),
+    ("mn", "Mongolian", "Монгол"),
+    ("mr", "Marathi", "मराठी"),
+    ("ms", "Malay", "Bahasa Melayu"),
+    ("mt", "Maltese", "Malti"),
+    ("my", "Burmese", "မြန်မာ"),
+    ("nb", "Norwegian Bokmål", "Norsk bokmål"),
+    ("ne", "Nepali", "नेपाली"),
+    ("nl", "Dutch", "Nederlands"),
+    ("nn", "Norwegian Nynorsk", "Norsk nynorsk"),
+    ("no", "Norwegian", "Norsk"),
+    ("ny", "Chichewa", "Chichewa"),
+    ("oc", "Occitan", "Occitan"),
+    ("om", "Oromo", "Afaan Oromoo"),
+    ("or", "Odia", "ଓଡ଼ିଆ"),
+    ("pa", "Punjabi", "ਪੰਜਾਬੀ"),
+    ("pl", "Polish", "Polski"),
+    ("ps", "Pashto", "پښتو"),
+    ("pt", "Portuguese", "Português"),
+    ("qu", "Quechua", "Runa Simi"),
+    ("rm", "Romansh", "Rumantsch"),
+    ("ro", "Romanian", "Română"),
+    ("ru", "Russian", "Русский"),
+    ("rw", "Kinyarwanda", "Ikinyarwanda"),
+    ("sa", "Sanskrit", "संस्कृतम्"),
+    ("sd", "Sindhi", "سنڌي"),
+    ("si", "Sinhala", "සිංහල"),
+    ("sk", "Slovak", "Slovenčina"),
+    ("sl", "Slovenian", "Slovenščina"),
+    ("sm", "Samoan", "Gagana Samoa"),
+    ("sn", "Shona", "ChiShona"),
+    ("so", "Somali", "Soomaali"),
+    ("sq", "Albanian", "Shqip"),
+    ("sr", "Serbian", "Српски"),
+    ("st", "Southern Sotho", "Sesotho"),
+    ("su", "Sundanese", "Basa Sunda"),
+    ("sv", "Swedish", "Svenska"),
+    ("sw", "Swahili", "Kiswahili"),
+    ("ta", "Tamil", "தமிழ்"),
+    ("te", "Telugu", "తెలుగు"),
+    ("tg", "Tajik", "Тоҷикӣ"),
+    ("th", "Thai", "ไทย"),
+    ("ti", "Tigrinya", "ትግርኛ"),
+    ("tk", "Turkmen", "Türkmençe"),
+    ("tl", "Tagalog", "Tagalog"),
+    ("tn", "Tswana", "Setswana"),
+    ("tr", "Turkish", "Türkçe"),
+    ("tt", "Tatar", "Татар"),
+    ("ug", "Uyghur", "ئۇيغۇرچە"),
+    ("uk", "Ukrainian", "Українська"),
+    ("ur", "Urdu", "اردو"),
+    ("uz", "Uzbek", "Oʻzbekcha"),
+    ("vi", "Vietnamese", "Tiếng Việt"),
+    ("wo", "Wolof", "Wolof"),
+    ("xh", "Xhosa", "IsiXhosa"),
+    ("yi", "Yiddish", "ייִדיש"),
+    ("yo", "Yoruba", "Yorùbá"),
+    ("zh", "Chinese", "中文"),
+    ("zu", "Zulu", "IsiZulu"),
+)
+
+@lru_cache(maxsize=1)
+def _index() -> Dict[str, Tuple[str, str, str]]:
+    """
+    Maps every case-folded code, English name and native name to its entry.
+    """
+    index = {}
+    for entry in ISO_LANGUAGES:
+        for key in entry:
+            index.setdefault(key.casefold(), entry)
+    return index
+
+
+def _is_typo(a: str, b: str) -> bool:
+    """
+    True if a and b differ by one dropped, doubled or swapped letter.
+    Substituted letters aren't accepted: they turn real languages into other
+    ones (Sorbian/Serbian).
+    """
+    if len(a) == len(b):
+        diff = [i for i, (x, y) in enumerate(zip(a, b, strict=True)) if x != y]
+        return (len(diff) == 2 and diff[1] == diff[0] + 1
+                and a[diff[0]] == b[diff[1]] and a[diff[1]] == b[diff[0]])
+    if len(a) < len(b):
+        a, b = b, a
+    return len(a) == len(b) + 1 and any(a[:i] + a[i + 1:] == b
+                                        for i in range(len(a)))
+
+
+def lookup_language(text: str) -> Optional[Tuple[str, str, str]]:
+    """
+    Resolves a language code, English name or native name (exactly, ignoring
+    case, or with a single-letter typo) to its (code, name, native name)
+    entry. Returns None if the text isn't recognised, or a typo could mean
+    more than one language, so the caller can ask the LLM instead.
+    """
+    key = " ".join(text.split()).casefold()
+    index = _index()
+    entry = index.get(key)
+    if entry is None and len(key) > 3:
+        matches = {
+            index[candidate]
+            for candidate in index if _is_typo(key, candidate)
+        }
+        if len(matches) == 1:
+            entry = matches.pop()
+    return entry
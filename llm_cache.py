@@ -0,0 +1,252 @@
+# llm_cache.py
+
+import asyncio
+import hashlib
+import inspect
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache, wraps
+from typing import Any, Dict, Hashable, Optional, Tuple, get_type_hints
+
+from pydantic import TypeAdapter
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+# SQLite file backing the persistent tier of @cached(persist=True)
+DISK_CACHE_PATH = os.getenv("LLM_CACHE_PATH", "llm_cache.sqlite")
+# Part of every @cached key; bumped when make_key changes so entries persisted
+# under the old key format are orphaned rather than served
+KEY_FORMAT = "2"
+
+
+@lru_cache(maxsize=4096)
+def make_key(*parts: Any) -> str:
+    """
+    Builds a cache key from the call arguments.
+    Whitespace is normalised so trivially different spellings of the same
+    query ("Heart  attack" / "Heart attack") share an entry. Case is kept:
+    medical terms and acronyms differ by it ("ALL" / "all").
+    Keys for repeated argument tuples are memoized.
+    """
+    normalized = "|".join(" ".join(str(part).split()) for part in parts)
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+class TTLCache:
+    """
+    Thread-safe in-memory LRU cache whose entries expire after `ttl` seconds.
+    """
+
+    def __init__(self, maxsize: int = 4096, ttl: float = 3600):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Returns the cached value for key, or default if absent or expired.
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Stores value under key, evicting the least recently used entry if full.
+        """
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        Drops every entry.
+        """
+        with self._lock:
+            self._data.clear()
+
+
+class DiskCache:
+    """
+    Thread-safe SQLite key/value store whose entries expire after a per-entry
+    ttl. Values are bytes; callers serialise them.
+    Expired rows are deleted when the store is opened and every
+    `purge_every` writes, so the file doesn't grow without bound.
+    """
+
+    def __init__(self, path: str, purge_every: int = 1000):
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache "
+            "(key TEXT PRIMARY KEY, value BLOB, expires_at REAL)")
+        self._lock = threading.Lock()
+        self._purge_every = purge_every
+        self._writes = 0
+        self.purge()
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Returns the stored bytes for key, or None if absent or expired.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM cache WHERE key = ? AND expires_at > ?",
+                (key, time.time())).fetchone()
+        return row[0] if row else None
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        """
+        Stores value under key for ttl seconds.
+        """
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache VALUES (?, ?, ?)",
+                (key, value, time.time() + ttl))
+            self._writes += 1
+            if self._writes % self._purge_every == 0:
+                self._delete_expired()
+
+    def purge(self) -> None:
+        """
+        Deletes the expired entries.
+        """
+        with self._lock, self._conn:
+            self._delete_expired()
+
+    def _delete_expired(self) -> None:
+        self._conn.execute("DELETE FROM cache WHERE expires_at <= ?",
+                           (time.time(), ))
+
+
+@lru_cache(maxsize=1)
+def _get_disk_cache() -> DiskCache:
+    """
+    Opens the shared disk cache on first use.
+    """
+    return DiskCache(DISK_CACHE_PATH)
+
+
+def cached(maxsize: int = 4096,
+           ttl: float = 3600,
+           persist: bool = False,
+           version: str = "",
+           error_ttl: float = 0,
+           casefold: Tuple[str, ...] = ()):
+    """
+    Decorator that memoizes an async function's result by exact (normalised)
+    arguments, with defaults filled in so passing a default explicitly hits
+    the same entry as omitting it. Exceptions are not cached, unless
+    error_ttl is set: then a failed call is re-raised to callers with the
+    same arguments for error_ttl seconds instead of being retried, so an
+    outage doesn't turn every request into another full attempt.
+    Concurrent calls with the same arguments share a single in-flight call
+    instead of each issuing their own.
+    With persist=True results are also stored in a SQLite file, so they
+    survive restarts and are shared between worker processes. They are
+    serialised as JSON according to the function's return annotation, and
+    read and written in a worker thread so a locked file never stalls the
+    event loop.
+    version is part of every key; changing it (e.g. when a prompt changes)
+    orphans the entries stored under the previous one.
+    casefold names the string arguments that are case-insensitive (e.g. a
+    language), so their spellings share an entry.
+    """
+
+    def decorator(func):
+        cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        errors = (TTLCache(maxsize=maxsize, ttl=error_ttl)
+                  if error_ttl else None)
+        signature = inspect.signature(func)
+        name = f"{KEY_FORMAT}:{func.__qualname__}@{version}"
+        inflight: Dict[str, asyncio.Task] = {}
+        adapter = (TypeAdapter(get_type_hints(func).get("return", Any))
+                   if persist else None)
+
+        def _load(key: str) -> Any:
+            try:
+                raw = _get_disk_cache().get(key)
+                if raw is not None:
+                    return adapter.validate_json(raw)
+            except (sqlite3.Error, ValueError) as e:
+                logger.warning("Disk cache read failed for %s: %s",
+                               func.__qualname__, e)
+            return _MISSING
+
+        def _store(key: str, value: Any) -> None:
+            try:
+                _get_disk_cache().set(key, adapter.dump_json(value), ttl)
+            except (sqlite3.Error, ValueError) as e:
+                logger.warning("Disk cache write failed for %s: %s",
+                               func.__qualname__, e)
+
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = make_key(
+                name,
+                *(value.casefold() if arg in casefold and isinstance(
+                    value, str) else value
+                  for arg, value in bound.arguments.items()))
+            value = cache.get(key, _MISSING)
+            if value is not _MISSING:
+                logger.debug("Cache hit for %s", func.__qualname__)
+                return value
+            if persist:
+                value = await asyncio.to_thread(_load, key)
+                if value is not _MISSING:
+                    logger.debug("Disk cache hit for %s", func.__qualname__)
+                    cache.set(key, value)
+                    return value
+            if errors is not None:
+                error = errors.get(key)
+                if error is not None:
+                    logger.debug("Cached failure for %s", func.__qualname__)
+                    raise error
+
+            task = inflight.get(key)
+            if task is None:
+                task = asyncio.ensure_future(func(*args, **kwargs))
+                inflight[key] = task
+
+                def _finish(done: asyncio.Task) -> None:
+                    inflight.pop(key, None)
+                    if done.cancelled():
+                        return
+                    if done.exception() is None:
+                        cache.set(key, done.result())
+                        if persist:
+                            asyncio.get_running_loop().run_in_executor(
+                                None, _store, key, done.result())
+                    elif errors is not None:
+                        errors.set(key, done.exception())
+
+                task.add_done_callback(_finish)
+            else:
+                logger.debug("Joining in-flight call for %s",
+                             func.__qualname__)
+            # A cancelled caller must not cancel the call other callers share
+            return await asyncio.shield(task)
+
+        wrapper.cache = cache
+        return wrapper
+
+    return decorator
@@ -1,45 +1,209 @@
 # main.py
 
-from typing import Union, List, Dict, Tuple
+from typing import AsyncIterator, Callable, Union, List, Dict, Tuple
 from datetime import datetime
-from fastapi import FastAPI, Query, HTTPException, Body
+from fastapi import FastAPI, Query, HTTPException, Body, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
 from enum import Enum
+import asyncio
+from contextlib import AsyncExitStack, asynccontextmanager
+import hashlib
+from functools import lru_cache
 import logging
+from logging.handlers import WatchedFileHandler
+import mimetypes
 import os
-import json
-import traceback
+import re
+import time
+import orjson
 
 # Import necessary functions from your workflow module
-from workflow import disambiguate, generate_synonyms, concept_lookup, get_language_info
+from llm_cache import TTLCache
+from workflow import (aclose_clients, adisambiguate, adisambiguate_models,
+                      agenerate_synonyms, agenerate_synonyms_many,
+                      aconcept_lookup,
+                      aconcept_lookup_stream, astream_disambiguate,
+                      get_language_info, lookup_language_info)
 
 # Import the updated SQLAlchemyChartData class
 from SQLAlchemyChartData import SQLAlchemyChartData
 
-# Initialize logging
+# Initialize logging; this is the application entry point, so its config
+# replaces whatever the imported modules set up. Every uvicorn worker appends
+# to the same file, so rotation is left to an external tool (logrotate):
+# WatchedFileHandler reopens the file once it has been moved away.
 logging.basicConfig(
-    level=logging.INFO,
+    level=os.getenv("LOG_LEVEL", "INFO").upper(),
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[logging.FileHandler("app.log"),
-              logging.StreamHandler()])
+    handlers=[
+        WatchedFileHandler(os.getenv("LOG_FILE", "app.log")),
+        logging.StreamHandler()
+    ],
+    force=True)
 logger = logging.getLogger(__name__)
 
 # Initialize SQLAlchemyChartData and seed initial languages
 chart_data = SQLAlchemyChartData()
 
-app = FastAPI()
+# Comma-separated list of models to disambiguate with. When more than one is
+# set, /api/search queries them concurrently and merges their meanings.
+DISAMBIGUATION_MODELS = [
+    model.strip()
+    for model in os.getenv("DISAMBIGUATION_MODELS", "").split(",")
+    if model.strip()
+]
+
+app = FastAPI(default_response_class=ORJSONResponse)
+
+# Explicit allow-lists let the CORS middleware answer preflights with a plain
+# set lookup instead of echoing back whatever the browser requested
+CORS_ORIGINS = ["http://localhost:5173"]  # Adjust as needed
+CORS_METHODS = ["GET", "POST", "OPTIONS"]
+CORS_HEADERS = ["content-type", "authorization"]
 
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["http://localhost:5173"],  # Adjust as needed
+    allow_origins=CORS_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=CORS_METHODS,
+    allow_headers=CORS_HEADERS,
 )
 
+# Metrics events are written by a background task so the DB insert stays off
+# the request path. Endpoints enqueue ("search" | "viewed_concept", row) pairs.
+METRICS_QUEUE_SIZE = 10_000
+METRICS_BATCH_SIZE = 100
+
+
+def _record_metric(kind: str, **row) -> None:
+    """
+    Queues a metrics row for the background writer; drops it if the queue is
+    full rather than slowing down the request.
+    """
+    row.setdefault("timestamp", datetime.utcnow())
+    try:
+        app.state.metrics_queue.put_nowait((kind, row))
+    except asyncio.QueueFull:
+        logger.warning("Metrics queue full, dropping %s event", kind)
+
+
+def _write_metrics(batch: List[Tuple[str, Dict]]) -> None:
+    """
+    Inserts a batch of queued metrics events.
+    """
+    searches = [row for kind, row in batch if kind == "search"]
+    viewed_concepts = [row for kind, row in batch if kind == "viewed_concept"]
+    chart_data.add_metric_events_bulk(searches, viewed_concepts)
+
+
+async def _drain_metrics(queue: asyncio.Queue) -> None:
+    """
+    Background task that writes queued metrics events in batches.
+    """
+    while True:
+        batch = [await queue.get()]
+        while len(batch) < METRICS_BATCH_SIZE and not queue.empty():
+            batch.append(queue.get_nowait())
+        try:
+            await asyncio.to_thread(_write_metrics, batch)
+        except Exception as e:
+            logger.error("Failed to write %d metrics events: %s", len(batch),
+                         e)
+
+
+@app.on_event("startup")
+async def start_metrics_writer():
+    app.state.metrics_queue = asyncio.Queue(maxsize=METRICS_QUEUE_SIZE)
+    app.state.metrics_task = asyncio.create_task(
+        _drain_metrics(app.state.metrics_queue))
+
+
+@app.on_event("shutdown")
+async def stop_metrics_writer():
+    app.state.metrics_task.cancel()
+    queue = app.state.metrics_queue
+    batch = []
+    while not queue.empty():
+        batch.append(queue.get_nowait())
+    if batch:
+        await asyncio.to_thread(_write_metrics, batch)
+
+
+@app.on_event("shutdown")
+async def close_clients():
+    await aclose_clients()
+
+
+# Backpressure for LLM-backed endpoints: at most LLM_CONCURRENCY requests talk
+# to the provider at once; others wait up to LLM_QUEUE_TIMEOUT seconds and are
+# then turned away with 429 instead of piling up.
+LLM_CONCURRENCY = int(os.getenv("LLM_CONCURRENCY", "32"))
+LLM_QUEUE_TIMEOUT = 30
+# /health/ready reports not ready once every slot has been busy this long
+LLM_SATURATION_GRACE = 10
+
+llm_semaphore = asyncio.Semaphore(LLM_CONCURRENCY)
+_llm_saturated_since = None
+
+
+@asynccontextmanager
+async def llm_slot():
+    """
+    Holds one LLM concurrency slot for the duration of the block.
+    Raises a 429 HTTPException if no slot frees up in time.
+    """
+    global _llm_saturated_since
+    try:
+        await asyncio.wait_for(llm_semaphore.acquire(),
+                               timeout=LLM_QUEUE_TIMEOUT)
+    except asyncio.TimeoutError:
+        logger.warning("No LLM slot available, rejecting request")
+        raise HTTPException(
+            status_code=429,
+            detail="Server is busy, please retry shortly") from None
+    if llm_semaphore.locked() and _llm_saturated_since is None:
+        _llm_saturated_since = time.monotonic()
+    try:
+        yield
+    finally:
+        llm_semaphore.release()
+        _llm_saturated_since = None
+
+
+async def _stream_slot() -> AsyncExitStack:
+    """
+    Takes an LLM slot for a streaming response before the response starts,
+    so a 429 can still be sent. Release it with _SlotStreamingResponse.
+    """
+    slot = AsyncExitStack()
+    await slot.enter_async_context(llm_slot())
+    return slot
+
+
+class _SlotStreamingResponse(StreamingResponse):
+    """
+    StreamingResponse that releases a _stream_slot however the response ends.
+    The body generator may release it earlier, but never runs its cleanup if
+    the client disconnects before the body starts.
+    """
+
+    def __init__(self, content, slot: AsyncExitStack, **kwargs):
+        super().__init__(content, **kwargs)
+        self.slot = slot
+
+    async def __call__(self, scope, receive, send):
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            # A no-op if the body already released it
+            await self.slot.aclose()
+
+
 # Define Pydantic models for requests and responses
 
 
@@ -56,6 +220,12 @@ class SearchResponse(BaseModel):
     search_id: int = Field(description="The ID of the search record")
 
 
+_DISAMBIGUATION_LIST = TypeAdapter(List[DisambiguationResult])
+
+# Markdown code fences the LLM sometimes wraps its JSON answer in
+_FENCE_RE = re.compile(r'^```(?:json)?\s*|```\s*$', re.MULTILINE)
+
+
 class SynonymResult(BaseModel):
     synonym: str = Field(description="A synonym for the given term")
     relevance: float = Field(
@@ -67,6 +237,23 @@ class SynonymResponse(BaseModel):
         description="List of synonyms with their relevance scores")
 
 
+# Terms go to the LLM in batches, but each request still holds one LLM slot
+# for all of them, so it can only ask for this many
+MAX_SYNONYM_TERMS_PER_REQUEST = 64
+
+
+class SynonymsBatchRequest(BaseModel):
+    terms: List[str] = Field(min_length=1,
+                             max_length=MAX_SYNONYM_TERMS_PER_REQUEST)
+    language: str = "en"
+    context: str
+
+
+class SynonymsBatchResponse(BaseModel):
+    synonyms: Dict[str, SynonymResponse] = Field(
+        description="Synonyms of each distinct input term")
+
+
 class ConceptTableRow(BaseModel):
     concept_id: int
     code: str
@@ -92,6 +279,25 @@ class CreateLanguageResponse(BaseModel):
     message: str
 
 
+# Each name may need an LLM call, so one request can only add this many
+MAX_LANGUAGES_PER_REQUEST = 50
+
+
+class CreateLanguagesRequest(BaseModel):
+    names: List[str] = Field(min_length=1,
+                             max_length=MAX_LANGUAGES_PER_REQUEST)
+
+
+class CreateLanguagesResponse(BaseModel):
+    created: List[str] = Field(
+        description="Codes of the languages that were added")
+    skipped: List[str] = Field(
+        description="Inputs that resolved to an existing or duplicate code")
+    failed: List[str] = Field(
+        default_factory=list,
+        description="Inputs that could not be resolved to a language")
+
+
 # Define an enumeration for metric types
 class MetricType(str, Enum):
     language_distribution = "language_distribution"
@@ -117,6 +323,21 @@ class MetricsDataResponse(BaseModel):
 # API Endpoints
 
 
+async def _language_info(name: str):
+    """
+    Resolves a language from the static table, falling back to the
+    get_language_info LMP under an LLM slot.
+    """
+    language_info = lookup_language_info(name)
+    if language_info is not None:
+        return language_info
+    # Normalised so "Ruso", " ruso" and "RUSO" share get_language_info's cache
+    name = " ".join(name.split()).casefold()
+    async with llm_slot():
+        result = await run_in_threadpool(get_language_info, name)
+    return result.parsed
+
+
 @app.post("/api/create_language", response_model=CreateLanguageResponse)
 async def create_language(request: CreateLanguageRequest):
     """
@@ -125,31 +346,88 @@ async def create_language(request: CreateLanguageRequest):
     try:
         logger.info(f"Attempting to create new language: {request.name}")
 
-        # Use get_language_info to get the language details
-        result = get_language_info(request.name)
-        language_info = result.parsed
+        language_info = await _language_info(request.name)
 
         # Check if language already exists
-        existing_language = chart_data.get_language_by_code(language_info.code)
+        existing_language = await asyncio.to_thread(
+            chart_data.get_language_by_code, language_info.code)
         if existing_language:
             return CreateLanguageResponse(
                 success=False,
                 message="A language with this code already exists.")
 
         # Add the new language
-        chart_data.add_language(name=language_info.name,
+        await asyncio.to_thread(chart_data.add_language,
+                                name=language_info.name,
                                 code=language_info.code,
                                 native_name=language_info.nativeName)
 
         message = "Language created successfully!"
         logger.info(message)
         return CreateLanguageResponse(success=True, message=message)
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Failed to create language: {e}")
         raise HTTPException(
             status_code=500,
-            detail=
-            "An error occurred while creating the language. Please try again.")
+            detail=("An error occurred while creating the language. "
+                    "Please try again.")) from e
+
+
+@app.post("/api/create_languages", response_model=CreateLanguagesResponse)
+async def create_languages(request: CreateLanguagesRequest):
+    """
+    Endpoint to create several languages at once.
+    Language lookups run concurrently and the new rows are inserted together.
+    Names that can't be resolved are reported in failed instead of failing
+    the whole request.
+    """
+    try:
+        logger.info("Attempting to create languages: %s", request.names)
+
+        results = await asyncio.gather(
+            *(_language_info(name) for name in request.names),
+            return_exceptions=True)
+
+        existing_codes = {
+            lang["value"]
+            for lang in await run_in_threadpool(chart_data.get_all_languages)
+        }
+        new_languages = []
+        skipped = []
+        failed = []
+        for name, language_info in zip(request.names, results, strict=True):
+            if isinstance(language_info, Exception):
+                logger.warning("Failed to resolve language %r: %s", name,
+                               language_info)
+                failed.append(name)
+                continue
+            code = language_info.code.lower()
+            if code in existing_codes:
+                skipped.append(name)
+                continue
+            existing_codes.add(code)
+            new_languages.append({
+                "name": language_info.name,
+                "code": code,
+                "native_name": language_info.nativeName
+            })
+
+        if new_languages:
+            await run_in_threadpool(chart_data.add_languages_bulk,
+                                    new_languages)
+
+        return CreateLanguagesResponse(
+            created=[lang["code"] for lang in new_languages],
+            skipped=skipped,
+            failed=failed)
+    except Exception as e:
+        logger.error("Failed to create languages: %s", e)
+        raise HTTPException(
+            status_code=500,
+            detail=("An error occurred while creating the languages. "
+                    "Please try again.")) from e
 
 
 @app.get("/api/languages")
@@ -158,12 +436,12 @@ async def get_languages():
     Endpoint to retrieve all available languages.
     """
     try:
-        languages = chart_data.get_all_languages()
+        languages = await asyncio.to_thread(chart_data.get_all_languages)
         return {"languages": languages}
     except Exception as e:
         logger.error(f"Failed to retrieve languages: {e}")
         raise HTTPException(status_code=500,
-                            detail="Failed to retrieve languages")
+                            detail="Failed to retrieve languages") from e
 
 
 @app.get("/api/language_info", response_model=dict)
@@ -173,23 +451,25 @@ async def language_info(input_text: str = Query(
     Endpoint to get language information based on input text.
     """
     try:
-        result = get_language_info(input_text)
-        language_info = result.parsed
+        language_info = await _language_info(input_text)
 
         # Record the language info request in the metrics
-        chart_data.add_search(language=language_info.code,
-                              term=input_text,
-                              led_to_concept_lookup=False)
+        _record_metric("search",
+                       language=language_info.code,
+                       term=input_text,
+                       led_to_concept_lookup=False)
 
         return {
             "name": language_info.name,
             "code": language_info.code,
             "nativeName": language_info.nativeName
         }
+    except HTTPException:
+        raise
     except Exception as e:
-        logger.error(f"An error occurred during language info retrieval: {e}")
-        logger.error(traceback.format_exc())
-        raise HTTPException(status_code=500, detail=f"An error occurred: {e}")
+        logger.exception("An error occurred during language info retrieval")
+        raise HTTPException(status_code=500,
+                            detail=f"An error occurred: {e}") from e
 
 
 @app.get("/api/concept_lookup")
@@ -198,21 +478,59 @@ async def get_concept_table(term: str, context: str, language: str):
     Endpoint to perform concept lookup.
     """
     try:
-        response = concept_lookup(term, context, language)
-        concepts = response.parsed.concepts
+        async with llm_slot():
+            response = await aconcept_lookup(term, context, language)
+        concepts = response.concepts
 
         # Record the concept lookup in the metrics
-        search_id = chart_data.add_search(language=language,
-                                          term=term,
-                                          led_to_concept_lookup=True)
+        _record_metric("search",
+                       language=language,
+                       term=term,
+                       led_to_concept_lookup=True)
         for concept in concepts:
-            chart_data.add_viewed_concept(concept=concept.name)
+            _record_metric("viewed_concept", concept=concept.name)
 
-        return {"concepts": [concept.dict() for concept in concepts]}
+        return {
+            # Rows are frozen and hold only str/int fields, so their
+            # __dict__ is already the JSON-ready dump
+            "concepts": [concept.__dict__ for concept in concepts]
+        }
+    except HTTPException:
+        raise
     except Exception as e:
-        logger.error(f"An error occurred during concept lookup: {e}")
-        logger.error(traceback.format_exc())
-        raise HTTPException(status_code=500, detail=str(e))
+        logger.exception("An error occurred during concept lookup")
+        raise HTTPException(status_code=500,
+                            detail=str(e)) from e
+
+
+@app.get("/api/concept_lookup/stream")
+async def stream_concept_table(term: str, context: str, language: str):
+    """
+    Streaming variant of /api/concept_lookup. Emits one NDJSON line per
+    concept as soon as Athena returns, with names as Athena spells them.
+    """
+    # Non-English terms are translated first, so the lookup needs a slot
+    slot = await _stream_slot()
+
+    async def rows():
+        async with slot:
+            try:
+                async for concept in aconcept_lookup_stream(
+                        term, context, language):
+                    _record_metric("viewed_concept", concept=concept.name)
+                    yield concept.model_dump_json().encode() + b"\n"
+            except Exception as e:
+                logger.exception("An error occurred during concept lookup")
+                yield orjson.dumps({"error": f"An error occurred: {e}"}) + b"\n"
+                return
+        _record_metric("search",
+                       language=language,
+                       term=term,
+                       led_to_concept_lookup=True)
+
+    return _SlotStreamingResponse(rows(),
+                                  slot,
+                                  media_type="application/x-ndjson")
 
 
 @app.get("/api/synonyms", response_model=SynonymResponse)
@@ -223,21 +541,95 @@ async def get_synonyms(term: str = Query(..., min_length=1),
     Endpoint to get synonyms for a given term.
     """
     try:
-        response = generate_synonyms(term, language, context)
-        synonym_response = response.parsed
+        async with llm_slot():
+            synonym_response = await agenerate_synonyms(
+                term, language, context)
 
         # Record the search in the metrics
-        search_id = chart_data.add_search(language=language,
-                                          term=term,
-                                          led_to_concept_lookup=False)
+        _record_metric("search",
+                       language=language,
+                       term=term,
+                       led_to_concept_lookup=False)
 
         # The synonyms are returned to the user; selections are recorded via /api/select_synonym
 
-        return synonym_response
+        return ORJSONResponse(synonym_response.model_dump(mode="json"))
+    except HTTPException:
+        raise
     except Exception as e:
-        logger.error(f"An error occurred during synonym generation: {e}")
-        logger.error(traceback.format_exc())
-        raise HTTPException(status_code=500, detail=f"An error occurred: {e}")
+        logger.exception("An error occurred during synonym generation")
+        raise HTTPException(status_code=500,
+                            detail=f"An error occurred: {e}") from e
+
+
+@app.post("/api/synonyms/batch", response_model=SynonymsBatchResponse)
+async def get_synonyms_batch(request: SynonymsBatchRequest):
+    """
+    Endpoint to get synonyms for several terms sharing a language and context.
+    The terms are sent to the LLM several per call, so the instructions are
+    paid for once per batch instead of once per term.
+    """
+    try:
+        async with llm_slot():
+            results = await agenerate_synonyms_many(request.terms,
+                                                    request.language,
+                                                    request.context)
+
+        for term in results:
+            _record_metric("search",
+                           language=request.language,
+                           term=term,
+                           led_to_concept_lookup=False)
+
+        return ORJSONResponse({
+            "synonyms": {
+                term: response.model_dump(mode="json")
+                for term, response in results.items()
+            }
+        })
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.exception("An error occurred during batch synonym generation")
+        raise HTTPException(status_code=500,
+                            detail=f"An error occurred: {e}") from e
+
+
+def _parse_disambiguation(response: str) -> List[DisambiguationResult]:
+    """
+    Parses and validates the JSON array returned by the disambiguation LLM.
+    Well-formed responses are parsed and validated in a single pydantic-core
+    pass; otherwise the JSON is parsed on its own and invalid meanings are
+    skipped.
+    """
+    response_message = _FENCE_RE.sub('', response).strip()
+    try:
+        return _DISAMBIGUATION_LIST.validate_json(response_message)
+    except ValidationError:
+        pass
+    try:
+        return _validate_disambiguations(orjson.loads(response_message))
+    except orjson.JSONDecodeError as e:
+        logger.error(f"Failed to parse JSON response: {e}")
+        logger.error(f"Raw response: {response_message}")
+        raise HTTPException(status_code=500,
+                            detail="Failed to parse LLM response") from e
+
+
+def _validate_disambiguations(
+        results: List[Dict]) -> List[DisambiguationResult]:
+    """
+    Validates the parsed meanings one by one, skipping invalid entries.
+    """
+    if not isinstance(results, list):
+        results = [results]
+    valid_results = []
+    for result in results:
+        try:
+            valid_results.append(DisambiguationResult.model_validate(result))
+        except ValidationError as e:
+            logger.warning(f"Skipping invalid result: {result}, Error: {e}")
+    return valid_results
 
 
 @app.get("/api/search", response_model=SearchResponse)
@@ -246,48 +638,127 @@ async def search(term: str = Query(..., min_length=1),
     """
     Endpoint to perform a search and disambiguation.
     """
-    logger.info(
-        f"Received search request for term: {term}, language: {language}")
+    logger.info("Received search request for term: %s, language: %s", term,
+                language)
     try:
         logger.debug("Calling disambiguate function")
-        response = disambiguate(term, language)
+        async with llm_slot():
+            if DISAMBIGUATION_MODELS:
+                responses = await adisambiguate_models(
+                    term, language, DISAMBIGUATION_MODELS)
+            else:
+                responses = [await adisambiguate(term, language)]
 
-        logger.debug(f"Disambiguate function returned: {response}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Disambiguate function returned: %s", responses)
 
-        # Extract and parse the response
-        response_message = response.text.strip().replace('```json',
-                                                         '').replace(
-                                                             '```', '')
-        try:
-            results = json.loads(response_message)
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse JSON response: {e}")
-            logger.error(f"Raw response: {response_message}")
-            raise HTTPException(status_code=500,
-                                detail="Failed to parse LLM response")
-
-        # Validate and convert to DisambiguationResult objects
+        results = []
+        for response in responses:
+            results.extend(_parse_disambiguation(response))
+
+        # Drop meanings repeated across models
         disambiguation_results = []
-        for result in results:
-            try:
-                disambiguation_results.append(DisambiguationResult(**result))
-            except Exception as e:
-                logger.warning(
-                    f"Skipping invalid result: {result}, Error: {e}")
+        seen_definitions = set()
+        for disambiguation_result in results:
+            definition = disambiguation_result.definition.casefold()
+            if definition in seen_definitions:
+                continue
+            seen_definitions.add(definition)
+            disambiguation_results.append(disambiguation_result)
 
         # Record the search in the metrics
-        search_id = chart_data.add_search(language=language,
-                                          term=term,
-                                          led_to_concept_lookup=False)
-
-        logger.info(
-            f"Returning {len(disambiguation_results)} disambiguation results")
-        return SearchResponse(results=disambiguation_results,
-                              search_id=search_id)
+        search_id = await asyncio.to_thread(chart_data.add_search,
+                                            language=language,
+                                            term=term,
+                                            led_to_concept_lookup=False)
+
+        logger.info("Returning %d disambiguation results",
+                    len(disambiguation_results))
+        return ORJSONResponse(
+            SearchResponse(results=disambiguation_results,
+                           search_id=search_id).model_dump(mode="json"))
+    except HTTPException:
+        raise
     except Exception as e:
-        logger.error(f"An error occurred during search: {e}")
-        logger.error(traceback.format_exc())
-        raise HTTPException(status_code=500, detail=f"An error occurred: {e}")
+        logger.exception("An error occurred during search")
+        raise HTTPException(status_code=500,
+                            detail=f"An error occurred: {e}") from e
+
+
+async def _stream_json_objects(
+        chunks: AsyncIterator[str]) -> AsyncIterator[str]:
+    """
+    Yields each object of a streamed top-level JSON array as soon as its
+    closing brace arrives. Text outside the array (code fences) is ignored.
+    """
+    buffer = []
+    depth = 0
+    in_string = escaped = False
+    async for chunk in chunks:
+        for char in chunk:
+            if depth == 0:
+                if char == '[':
+                    depth = 1
+                continue
+            if depth >= 2:
+                buffer.append(char)
+            if in_string:
+                if escaped:
+                    escaped = False
+                elif char == '\\':
+                    escaped = True
+                elif char == '"':
+                    in_string = False
+            elif char == '"':
+                in_string = True
+            elif char in '[{':
+                depth += 1
+                if depth == 2:
+                    buffer.append(char)
+            elif char in ']}':
+                depth -= 1
+                if depth == 1 and buffer:
+                    yield ''.join(buffer)
+                    buffer.clear()
+
+
+@app.get("/api/search/stream")
+async def search_stream(term: str = Query(..., min_length=1),
+                        language: str = Query("en")):
+    """
+    Streaming variant of /api/search. Emits one NDJSON line per meaning as the
+    LLM produces it, followed by a final {"search_id": ...} line.
+    """
+    logger.info("Received streaming search request for term: %s, language: %s",
+                term, language)
+    slot = await _stream_slot()
+
+    async def results():
+        async with slot:
+            try:
+                async for raw in _stream_json_objects(
+                        astream_disambiguate(term, language)):
+                    try:
+                        result = DisambiguationResult.model_validate_json(raw)
+                    except ValidationError as e:
+                        logger.warning(
+                            f"Skipping invalid result: {raw}, Error: {e}")
+                        continue
+                    yield orjson.dumps(result.__dict__) + b"\n"
+            except Exception as e:
+                logger.exception("An error occurred during streaming search")
+                yield orjson.dumps({"error": f"An error occurred: {e}"}) + b"\n"
+                return
+
+        search_id = await asyncio.to_thread(chart_data.add_search,
+                                            language=language,
+                                            term=term,
+                                            led_to_concept_lookup=False)
+        yield orjson.dumps({"search_id": search_id}) + b"\n"
+
+    return _SlotStreamingResponse(results(),
+                                  slot,
+                                  media_type="application/x-ndjson")
 
 
 @app.post("/api/select_synonym")
@@ -301,11 +772,36 @@ async def select_synonym(selection: Dict = Body(...)):
         if not search_id or not synonym:
             raise HTTPException(status_code=400,
                                 detail="search_id and synonym are required")
-        chart_data.add_selected_synonym(search_id=search_id, synonym=synonym)
+        await asyncio.to_thread(chart_data.add_selected_synonym,
+                                search_id=search_id,
+                                synonym=synonym)
         return {"success": True}
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"An error occurred during synonym selection: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+        raise HTTPException(status_code=500,
+                            detail=str(e)) from e
+
+
+@app.get("/health/live")
+def health_live():
+    """
+    Liveness probe: the process is up and serving requests.
+    """
+    return {"status": "ok"}
+
+
+@app.get("/health/ready")
+def health_ready():
+    """
+    Readiness probe: fails while every LLM slot has been busy for longer than
+    LLM_SATURATION_GRACE seconds, so load balancers route elsewhere.
+    """
+    if (_llm_saturated_since is not None and
+            time.monotonic() - _llm_saturated_since > LLM_SATURATION_GRACE):
+        raise HTTPException(status_code=503, detail="LLM capacity exhausted")
+    return {"status": "ok"}
 
 
 @app.get("/api")
@@ -318,75 +814,118 @@ def read_root():
 
 # Metrics Endpoints
 
+# Dashboards poll these endpoints, so each payload is kept for a few seconds
+# and served with an ETag that lets unchanged responses return 304.
+_all_metrics_cache = TTLCache(maxsize=1, ttl=15)
+_metric_cache = TTLCache(maxsize=len(MetricType), ttl=30)
+
+
+def _with_etag(payload: Dict) -> Tuple[Dict, str]:
+    """
+    Pairs a JSON-serialisable payload with its ETag.
+    """
+    return payload, f'"{hashlib.sha1(orjson.dumps(payload)).hexdigest()}"'
+
+
+def _etag_response(request: Request, payload: Dict, etag: str) -> Response:
+    """
+    Returns 304 Not Modified when the client already holds this payload,
+    otherwise the payload with its ETag header set.
+    """
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    return ORJSONResponse(payload, headers={"ETag": etag})
+
 
 @app.get("/api/metrics", response_model=MetricsDataResponse)
-async def get_all_metrics():
+async def get_all_metrics(request: Request):
     """
      Endpoint to retrieve all metrics data.
      """
     try:
-        language_distribution = chart_data.get_language_distribution()
-        total_searches = chart_data.get_total_searches()
-        search_trend = chart_data.get_search_trend()
-        common_search_terms = chart_data.get_common_search_terms()
-        concept_lookup_percentage = chart_data.get_concept_lookup_percentage()
-        most_viewed_concepts = chart_data.get_most_viewed_concepts()
-        most_selected_synonyms = chart_data.get_most_selected_synonyms()
+        cached = _all_metrics_cache.get("all")
+        if cached is not None:
+            return _etag_response(request, *cached)
+
+        if chart_data.supports_one_shot_metrics():
+            metrics = await asyncio.to_thread(
+                chart_data.get_all_metrics_one_shot)
+        else:
+            # Each query checks out its own pooled connection, so running
+            # them in worker threads costs the slowest query, not their sum
+            (language_distribution, total_searches, search_trend,
+             common_search_terms, concept_lookup_percentage,
+             most_viewed_concepts, most_selected_synonyms) = await asyncio.gather(
+                 asyncio.to_thread(chart_data.get_language_distribution),
+                 asyncio.to_thread(chart_data.get_total_searches),
+                 asyncio.to_thread(chart_data.get_search_trend),
+                 asyncio.to_thread(chart_data.get_common_search_terms),
+                 asyncio.to_thread(chart_data.get_concept_lookup_percentage),
+                 asyncio.to_thread(chart_data.get_most_viewed_concepts),
+                 asyncio.to_thread(chart_data.get_most_selected_synonyms))
+            metrics = {
+                "language_distribution": language_distribution,
+                "total_searches": total_searches,
+                "search_trend": search_trend,
+                "common_search_terms": common_search_terms,
+                "concept_lookup_percentage": concept_lookup_percentage,
+                "most_viewed_concepts": most_viewed_concepts,
+                "most_selected_synonyms": most_selected_synonyms
+            }
 
         logger.info("Retrieved all metrics data")
 
-        return MetricsDataResponse(
-            language_distribution=language_distribution,
-            total_searches=total_searches,
-            search_trend=search_trend,
-            common_search_terms=common_search_terms,
-            concept_lookup_percentage=concept_lookup_percentage,
-            most_viewed_concepts=most_viewed_concepts,
-            most_selected_synonyms=most_selected_synonyms)
+        cached = _with_etag(
+            MetricsDataResponse(**metrics).model_dump(mode="json"))
+        _all_metrics_cache.set("all", cached)
+        return _etag_response(request, *cached)
     except Exception as e:
         logger.error(f"Failed to retrieve metrics data: {e}")
         raise HTTPException(status_code=500,
-                            detail="Failed to retrieve metrics data")
+                            detail="Failed to retrieve metrics data") from e
+
+
+# FastAPI rejects unknown metric types before the handler runs, so every
+# MetricType has an entry here
+METRIC_DISPATCH: Dict[MetricType, Tuple[Callable, str]] = {
+    MetricType.language_distribution:
+    (chart_data.get_language_distribution, "language_distribution"),
+    MetricType.total_searches: (chart_data.get_total_searches,
+                                "total_searches"),
+    MetricType.search_trend: (chart_data.get_search_trend, "search_trend"),
+    MetricType.common_search_terms:
+    (chart_data.get_common_search_terms, "common_search_terms"),
+    MetricType.concept_lookup_percentage:
+    (chart_data.get_concept_lookup_percentage, "concept_lookup_percentage"),
+    MetricType.most_viewed_concepts:
+    (chart_data.get_most_viewed_concepts, "most_viewed_concepts"),
+    MetricType.most_selected_synonyms:
+    (chart_data.get_most_selected_synonyms, "most_selected_synonyms"),
+}
 
 
 @app.get("/api/metrics/{metric_type}")
-async def get_metric(metric_type: MetricType):
+async def get_metric(metric_type: MetricType, request: Request):
     """
     Endpoint to retrieve specific metric data.
     """
     try:
-        metric_functions = {
-            MetricType.language_distribution:
-            (chart_data.get_language_distribution, "language_distribution"),
-            MetricType.total_searches: (chart_data.get_total_searches,
-                                        "total_searches"),
-            MetricType.search_trend: (chart_data.get_search_trend,
-                                      "search_trend"),
-            MetricType.common_search_terms:
-            (chart_data.get_common_search_terms, "common_search_terms"),
-            MetricType.concept_lookup_percentage:
-            (chart_data.get_concept_lookup_percentage,
-             "concept_lookup_percentage"),
-            MetricType.most_viewed_concepts:
-            (chart_data.get_most_viewed_concepts, "most_viewed_concepts"),
-            MetricType.most_selected_synonyms:
-            (chart_data.get_most_selected_synonyms, "most_selected_synonyms"),
-        }
-
-        if metric_type not in metric_functions:
-            logger.warning(f"Invalid metric type requested: {metric_type}")
-            raise HTTPException(status_code=400, detail="Invalid metric type")
+        cached = _metric_cache.get(metric_type)
+        if cached is not None:
+            return _etag_response(request, *cached)
 
-        function, key = metric_functions[metric_type]
-        data = function()
+        function, key = METRIC_DISPATCH[metric_type]
+        data = await asyncio.to_thread(function)
 
-        logger.info(f"Retrieved data for metric type: {metric_type}")
-        return {key: data}
+        logger.info("Retrieved data for metric type: %s", metric_type)
+        cached = _with_etag({key: data})
+        _metric_cache.set(metric_type, cached)
+        return _etag_response(request, *cached)
     except Exception as e:
         logger.error(f"Failed to retrieve data for metric {metric_type}: {e}")
         raise HTTPException(
             status_code=500,
-            detail=f"Failed to retrieve data for metric {metric_type}")
+            detail=f"Failed to retrieve data for metric {metric_type}") from e
 
 
 @app.get("/api/search_paths")
@@ -395,20 +934,91 @@ async def get_search_paths():
     Endpoint to retrieve the paths of all searches.
     """
     try:
-        search_paths = chart_data.get_search_paths()
+        search_paths = await asyncio.to_thread(chart_data.get_search_paths)
         return {"search_paths": search_paths}
     except Exception as e:
         logger.error(f"Failed to retrieve search paths: {e}")
         raise HTTPException(status_code=500,
-                            detail="Failed to retrieve search paths")
+                            detail="Failed to retrieve search paths") from e
+
+
+class CachedStaticFiles(StaticFiles):
+    """
+    StaticFiles for the production build. Files of the build don't change while
+    the process runs, so the lookups (and stat calls) of paths that exist are
+    cached in a bounded LRU; misses are not, so arbitrary request paths can't
+    grow it and files added later are found. Precompressed .br/.gz siblings
+    are served when the client accepts them.
+    Content-hashed /assets/* files are marked immutable; everything else
+    (index.html) must be revalidated.
+    """
+
+    ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+    LOOKUP_CACHE_SIZE = 1024
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._lookup_existing = lru_cache(maxsize=self.LOOKUP_CACHE_SIZE)(
+            self._lookup_existing)
+
+    def _lookup_existing(self, path: str) -> Tuple[str, os.stat_result]:
+        # Raising keeps misses out of the lru_cache
+        full_path, stat_result = super().lookup_path(path)
+        if stat_result is None:
+            raise FileNotFoundError(path)
+        return full_path, stat_result
+
+    def lookup_path(self, path: str):
+        try:
+            return self._lookup_existing(path)
+        except FileNotFoundError:
+            return "", None
+
+    def file_response(self, full_path, stat_result, scope, status_code=200):
+        accept_encoding = dict(scope["headers"]).get(b"accept-encoding", b"")
+        for encoding, suffix in self.ENCODINGS:
+            if encoding.encode() not in accept_encoding:
+                continue
+            compressed_path, compressed_stat = self.lookup_path(
+                os.path.relpath(full_path, os.path.realpath(self.directory)) +
+                suffix)
+            if compressed_stat is None:
+                continue
+            response = super().file_response(compressed_path, compressed_stat,
+                                             scope, status_code)
+            response.headers["content-type"] = (
+                self._media_type(full_path) or "application/octet-stream")
+            response.headers["content-encoding"] = encoding
+            response.headers["vary"] = "Accept-Encoding"
+            return response
+        return super().file_response(full_path, stat_result, scope, status_code)
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _media_type(path: str) -> Union[str, None]:
+        return mimetypes.guess_type(path)[0]
+
+    async def get_response(self, path: str, scope) -> Response:
+        response = await super().get_response(path, scope)
+        if path.startswith("assets/"):
+            response.headers["cache-control"] = (
+                "public, max-age=31536000, immutable")
+        else:
+            response.headers["cache-control"] = "no-cache"
+        return response
 
 
 # Serve React frontend only if the dist directory exists
 if os.path.exists("frontend/dist"):
     app.mount("/",
-              StaticFiles(directory="frontend/dist", html=True),
+              CachedStaticFiles(directory="frontend/dist", html=True),
               name="frontend")
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    uvicorn.run("main:app",
+                host="0.0.0.0",
+                port=8000,
+                loop="uvloop",
+                http="httptools",
+                workers=max(1, os.cpu_count() or 1))
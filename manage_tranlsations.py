@@ -1,54 +1,302 @@
+import atexit
+import hashlib
 import json
 import os
+import orjson
+import re
 import shutil
+import sqlite3
+import threading
 from pathlib import Path
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from logging.handlers import QueueHandler, QueueListener
+import queue
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import ell
+from openai import AsyncOpenAI
+from openai_batch import run_chat_batch
 
 # --------------------------------------------------------------------------------
 # INSTRUCTIONS:
-# 1. Backup translation files: Choose option 1 from the menu.
+# 1. Backup translation files: Choose option 1 from the menu. Backups are hard links
+#    when possible, so edit locale files by replacing them (as this tool does),
+#    not in place, or the backup changes too.
 # 2. Restore translation files: Choose option 2 from the menu.
-# 3. Update all keys: Choose option 3, optimize translation using concurrency.
+# 3. Update all keys: Choose option 3, translations are requested concurrently.
 # 4. Update specific keys: Choose option 4, specify keys.
-# 5. Create new language: Choose option 5, auto-translate new language.
+# 5. Create new language: Choose option 5, auto-translate new language
+#    (optionally through the cheaper, slower OpenAI Batch API).
 # 6. Exit: Choose option 6 to exit.
 #
 # Translation Optimization: Only un-translated or changed content will be updated.
 # --------------------------------------------------------------------------------
 
 # Configure logging
-logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
+# Records are handed to a queue and written by a single listener thread, so
+# worker threads never block on the console while holding the handler lock
+_log_queue = queue.SimpleQueue()
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(logging.Formatter('%(levelname)s: %(message)s'))
+_log_listener = QueueListener(_log_queue, _log_handler)
+# QueueHandler formats records before enqueueing them; keep that to the bare
+# message so the listener's formatter doesn't prefix it a second time
+_queue_handler = QueueHandler(_log_queue)
+_queue_handler.setFormatter(logging.Formatter('%(message)s'))
+logging.basicConfig(level=logging.INFO, handlers=[_queue_handler])
+_log_listener.start()
+atexit.register(_log_listener.stop)
 
 # Paths to the locales directory and backup directory
 LOCALES_DIR = Path('/home/runner/workspace/frontend/public/locales')
 BACKUP_DIR = Path('/home/runner/workspace/frontend/public/locales_backup')
+# Persistent translation memo, so unchanged strings are never paid for twice
+CACHE_PATH = LOCALES_DIR.parent / '_translation_cache.sqlite'
+
+
+TRANSLATION_MODEL = "gpt-4o-mini"
 
 
 # ELL translation function with an improved prompt
-@ell.simple(model="gpt-4o-mini")
+@ell.simple(model=TRANSLATION_MODEL)
 def translate(text, target_language):
     """You are a highly accurate translation assistant. Your task is to translate the provided text clearly and concisely into the specified target language. Provide only the translated text with no additional comments or formatting."""
 
     return f"Translate the following text into {target_language}:\n\n{text}\n\nProvide only the translated text with no additional comments."
 
 
+# Separator between texts in a batched translation request
+BATCH_SEPARATOR = '\n%%\n'
+# Upper bound on the source characters sent in a single batched request
+BATCH_MAX_CHARS = 4000
+
+
+@ell.simple(model=TRANSLATION_MODEL)
+def translate_batch(texts, target_language):
+    """You are a highly accurate translation assistant. You will receive several texts separated by lines containing only %%. Translate each text clearly and concisely into the specified target language. Reply with the translations in the same order, separated by lines containing only %%, with no additional comments or formatting."""
+
+    joined = BATCH_SEPARATOR.join(texts)
+    return f"Translate each of the following {len(texts)} texts into {target_language}:\n\n{joined}\n\nProvide only the {len(texts)} translated texts, separated by lines containing only %%."
+
+
+def _batches(texts, max_chars=BATCH_MAX_CHARS):
+    """Split texts into consecutive batches of at most max_chars characters."""
+    batch, size = [], 0
+    for text in texts:
+        if batch and size + len(text) > max_chars:
+            yield batch
+            batch, size = [], 0
+        batch.append(text)
+        size += len(text)
+    if batch:
+        yield batch
+
+
+# --------------------------------------------------------------------------------
+# TRANSLATION CACHE: SQLite-backed memo keyed by sha256(language + text), shared by
+# all worker threads, plus an in-process dict for repeats within a run.
+# --------------------------------------------------------------------------------
+_cache_lock = threading.Lock()
+_cache_conn = None
+_memo = {}
+
+
+def _cache_key(text, target_language):
+    return hashlib.sha256(
+        (target_language + '\0' + text).encode('utf-8')).hexdigest()
+
+
+def _get_cache():
+    """Open the translation cache on first use."""
+    global _cache_conn
+    if _cache_conn is None:
+        CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        _cache_conn = sqlite3.connect(CACHE_PATH, check_same_thread=False)
+        _cache_conn.execute('PRAGMA journal_mode=WAL')
+        _cache_conn.execute(
+            'CREATE TABLE IF NOT EXISTS translations (key TEXT PRIMARY KEY, val TEXT)'
+        )
+    return _cache_conn
+
+
+def _cache_get(keys):
+    """Return {key: translation} for the keys present in the cache."""
+    with _cache_lock:
+        found = {key: _memo[key] for key in keys if key in _memo}
+        missing = [key for key in keys if key not in found]
+        if missing:
+            conn = _get_cache()
+            for key in missing:
+                row = conn.execute('SELECT val FROM translations WHERE key=?',
+                                   (key, )).fetchone()
+                if row:
+                    found[key] = _memo[key] = row[0]
+    return found
+
+
+def _cache_put(items):
+    """Store (key, translation) pairs in the cache."""
+    with _cache_lock:
+        _memo.update(items)
+        conn = _get_cache()
+        with conn:
+            conn.executemany(
+                'INSERT OR REPLACE INTO translations (key, val) VALUES (?, ?)',
+                items)
+
+
+_SPACE_RUNS = re.compile(r'[ \t]+')
+_OUTER_SPACE = re.compile(r'^(\s*).*?(\s*)$', re.DOTALL)
+
+
+def _normalize(text):
+    """Canonical form used for caching: outer whitespace stripped and runs of
+       spaces/tabs collapsed, so "Save " and "Save" share one translation."""
+    return _SPACE_RUNS.sub(' ', text.strip())
+
+
+async def translate_many(texts, target_language, semaphore):
+    """Translate a list of texts, serving previously translated strings from the
+       cache and sending only the rest to the LLM. Texts that are identical after
+       whitespace normalisation (e.g. several keys sharing the same English value)
+       are translated once and fanned back out to every position, with each
+       text's own leading/trailing whitespace restored."""
+    normalized = [_normalize(text) for text in texts]
+    keys = {
+        text: _cache_key(text, target_language)
+        for text in dict.fromkeys(normalized) if text
+    }
+    cached = _cache_get(list(keys.values()))
+    misses = [text for text, key in keys.items() if key not in cached]
+    if misses:
+        translations = await _translate_uncached(misses, target_language,
+                                                 semaphore)
+        new_items = [(keys[text], translation)
+                     for text, translation in zip(
+                         misses, translations, strict=True)]
+        _cache_put(new_items)
+        cached.update(new_items)
+    results = []
+    for text, norm in zip(texts, normalized, strict=True):
+        if not norm:
+            # Nothing to translate in an empty or whitespace-only string
+            results.append(text)
+            continue
+        leading, trailing = _OUTER_SPACE.match(text).groups()
+        results.append(leading + cached[keys[norm]] + trailing)
+    return results
+
+
+# --------------------------------------------------------------------------------
+# ASYNC LLM CALLS: All batches for all languages are issued concurrently on one
+# event loop; a semaphore caps the number of requests in flight.
+# --------------------------------------------------------------------------------
+# Retries on 429/5xx responses; the client backs off exponentially and honours
+# the Retry-After header, so throttled requests wait instead of failing a file
+OPENAI_MAX_RETRIES = int(os.getenv('OPENAI_MAX_RETRIES', '6'))
+
+_async_client = None
+
+
+def _get_async_client():
+    """Create the AsyncOpenAI client on first use."""
+    global _async_client
+    if _async_client is None:
+        _async_client = AsyncOpenAI(max_retries=OPENAI_MAX_RETRIES)
+    return _async_client
+
+
+@lru_cache(maxsize=None)
+def _system_message(lmp):
+    """The system message of an @ell.simple prompt (its docstring)."""
+    return {"role": "system", "content": lmp.__ell_func__.__doc__}
+
+
+def _simple_messages(lmp, *args):
+    """Build the chat messages of an @ell.simple prompt: its docstring is the
+       system prompt and its return value the user message."""
+    return [
+        _system_message(lmp), {
+            "role": "user",
+            "content": lmp.__ell_func__(*args)
+        }
+    ]
+
+
+_TEXT_PLACEHOLDER = '\0text\0'
+
+
+@lru_cache(maxsize=256)
+def _translate_template(target_language):
+    """translate's user prompt specialised for one language, as the
+       (prefix, suffix) around the text. Rendered once per language."""
+    prefix, suffix = translate.__ell_func__(_TEXT_PLACEHOLDER,
+                                            target_language).split(
+                                                _TEXT_PLACEHOLDER)
+    return prefix, suffix
+
+
+def _translate_messages(text, target_language):
+    """Chat messages for translating a single text."""
+    prefix, suffix = _translate_template(target_language)
+    return [
+        _system_message(translate), {
+            "role": "user",
+            "content": prefix + text + suffix
+        }
+    ]
+
+
+async def _acomplete(messages, semaphore):
+    """Run a chat completion, holding a semaphore slot while it is in flight."""
+    async with semaphore:
+        response = await _get_async_client().chat.completions.create(
+            model=TRANSLATION_MODEL, messages=messages)
+    return response.choices[0].message.content
+
+
+async def _atranslate_batch(batch, target_language, semaphore):
+    """Translate one batch with a single call, falling back to per-text calls
+       if the reply does not line up."""
+    if len(batch) == 1:
+        return [
+            await _acomplete(_translate_messages(batch[0], target_language),
+                             semaphore)
+        ]
+    reply = await _acomplete(
+        _simple_messages(translate_batch, batch, target_language), semaphore)
+    parts = [part.strip() for part in reply.split('%%')]
+    if len(parts) != len(batch):
+        logging.warning(
+            f"Batch translation returned {len(parts)} items for {len(batch)} texts; translating individually"
+        )
+        parts = await asyncio.gather(
+            *(_acomplete(_translate_messages(text, target_language),
+                         semaphore) for text in batch))
+    return list(parts)
+
+
+async def _translate_uncached(texts, target_language, semaphore):
+    """Translate a list of texts with one LLM call per batch, running the
+       batches concurrently."""
+    results = await asyncio.gather(
+        *(_atranslate_batch(batch, target_language, semaphore)
+          for batch in _batches(texts)))
+    return [translation for batch in results for translation in batch]
 # --------------------------------------------------------------------------------
 # BACKUP FUNCTION: Create a backup of all JSON translation files in a separate folder.
 # --------------------------------------------------------------------------------
 def backup_files():
-    """Create a backup of all JSON files in a separate folder."""
+    """Create a backup of all JSON files in a separate folder.
+       Files are hard-linked into the backup when it is on the same filesystem,
+       which is safe because save_json replaces files instead of rewriting them."""
     try:
         if not BACKUP_DIR.exists():
             BACKUP_DIR.mkdir(parents=True)
 
-        for file_path in LOCALES_DIR.rglob('*.json'):
-            relative_path = file_path.relative_to(LOCALES_DIR)
-            backup_file_path = BACKUP_DIR / relative_path
-            backup_file_path.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(file_path, backup_file_path)
-            logging.info(f"Backed up {file_path} to {backup_file_path}")
+        copied = copy_tree_files(LOCALES_DIR, BACKUP_DIR, link=True)
+        logging.info(f"Backed up {copied} files to {BACKUP_DIR}")
     except Exception as e:
         logging.error(f"Error during backup: {e}")
 
@@ -57,23 +305,67 @@ def backup_files():
 # RESTORE FUNCTION: Restore all translation files from the backup folder.
 # --------------------------------------------------------------------------------
 def restore_backup():
-    """Restore all JSON files from the backup folder to the original location."""
+    """Restore all JSON files from the backup folder to the original location.
+       Restores always make real copies, so later edits never reach the backup."""
     try:
         if not BACKUP_DIR.exists():
             logging.error("No backup directory found!")
             return
 
-        for backup_file_path in BACKUP_DIR.rglob('*.json'):
-            relative_path = backup_file_path.relative_to(BACKUP_DIR)
-            original_file_path = LOCALES_DIR / relative_path
-            original_file_path.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(backup_file_path, original_file_path)
-            logging.info(
-                f"Restored {backup_file_path} to {original_file_path}")
+        copied = copy_tree_files(BACKUP_DIR, LOCALES_DIR)
+        # Restored files no longer match what save_json last wrote
+        _saved_digests.clear()
+        logging.info(f"Restored {copied} files from {BACKUP_DIR}")
     except Exception as e:
         logging.error(f"Error during restore: {e}")
 
 
+# Copies are I/O-bound, so many can overlap on slow or network disks
+COPY_WORKERS = 32
+
+
+def _copy_one(paths):
+    src, dst = paths
+    os.makedirs(os.path.dirname(dst), exist_ok=True)
+    if os.path.exists(dst) and os.path.samefile(src, dst):
+        return
+    # copy2 uses the kernel's zero-copy path (sendfile) on Linux
+    shutil.copy2(src, dst)
+
+
+def _link_one(paths):
+    """Hard-link src to dst (metadata only), falling back to a copy when the
+       two are on different filesystems or linking is not supported."""
+    src, dst = paths
+    os.makedirs(os.path.dirname(dst), exist_ok=True)
+    try:
+        if os.path.exists(dst):
+            if os.path.samefile(src, dst):
+                return
+            os.unlink(dst)
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+def copy_tree_files(src_dir, dst_dir, link=False):
+    """Copy every JSON file (and its .src sidecar) under src_dir to the same
+       relative path under dst_dir, using a thread pool. With link=True files
+       are hard-linked where possible. Returns the number of files copied."""
+    # Plain strings and os.walk: no Path objects are built per file
+    src_root, dst_root = str(src_dir), str(dst_dir)
+    pairs = []
+    for dirpath, _, filenames in os.walk(src_root):
+        dst_dirpath = os.path.join(dst_root,
+                                   os.path.relpath(dirpath, src_root))
+        pairs.extend((os.path.join(dirpath, name),
+                      os.path.join(dst_dirpath, name)) for name in filenames
+                     if name.endswith(('.json', '.json.src')))
+    with ThreadPoolExecutor(max_workers=COPY_WORKERS) as executor:
+        list(executor.map(_link_one if link else _copy_one, pairs))
+    return len(pairs)
+
+
 # --------------------------------------------------------------------------------
 # UTILITY FUNCTIONS: To load and save JSON files.
 # --------------------------------------------------------------------------------
@@ -82,19 +374,32 @@ def load_json(filepath):
     try:
         if not filepath.exists():
             return {}
-        with filepath.open('r', encoding='utf-8') as f:
-            return json.load(f)
+        return orjson.loads(filepath.read_bytes())
     except Exception as e:
         logging.error(f"Error loading JSON file {filepath}: {e}")
         return {}
 
 
+# Digest of the bytes last written to each path, to skip no-op saves
+_saved_digests = {}
+
+
 def save_json(filepath, content):
-    """Save content to a JSON file."""
+    """Save content to a JSON file.
+       The file is written to a temporary sibling and swapped in with os.replace,
+       so an interrupted save never leaves a truncated file. Saves that would
+       not change the file are skipped."""
     try:
+        data = json.dumps(content, ensure_ascii=False,
+                          indent=4).encode('utf-8')
+        digest = hashlib.blake2b(data, digest_size=16).digest()
+        if _saved_digests.get(filepath) == digest:
+            return
         filepath.parent.mkdir(parents=True, exist_ok=True)
-        with filepath.open('w', encoding='utf-8') as f:
-            json.dump(content, f, ensure_ascii=False, indent=4)
+        tmp_path = filepath.with_name(filepath.name + '.tmp')
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, filepath)
+        _saved_digests[filepath] = digest
     except Exception as e:
         logging.error(f"Error saving JSON file {filepath}: {e}")
 
@@ -102,62 +407,153 @@ def save_json(filepath, content):
 # --------------------------------------------------------------------------------
 # FUNCTION: Ensure that new JSON files in the English folder are added to all other languages.
 # --------------------------------------------------------------------------------
-def ensure_file_exists_for_all_languages(en_file):
-    """Ensure that if a new JSON file exists in the English folder,
-       the corresponding file exists in all other language folders."""
-    for lang_dir in LOCALES_DIR.iterdir():
-        if lang_dir.is_dir() and lang_dir.name != 'en':
-            lang_file = lang_dir / en_file.relative_to(LOCALES_DIR / 'en')
-            if not lang_file.exists():
-                save_json(lang_file, {})
-                logging.info(
-                    f"Created new file {lang_file} for language {lang_dir.name}"
-                )
+def _scan_json_files(directory, prefix=''):
+    """Yield the relative paths of all JSON files under directory."""
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                yield from _scan_json_files(entry.path,
+                                            prefix + entry.name + os.sep)
+            elif entry.name.endswith('.json'):
+                yield prefix + entry.name
+
+
+def scan_locales():
+    """Walk LOCALES_DIR once and return {language: set of relative JSON paths}."""
+    with os.scandir(LOCALES_DIR) as entries:
+        return {
+            entry.name: set(_scan_json_files(entry.path))
+            for entry in entries if entry.is_dir()
+        }
+
+
+def ensure_files_exist_for_all_languages(existing):
+    """Ensure that every JSON file in the English folder has a counterpart in
+       all other language folders, using one set difference per language.
+       existing is the scan_locales() result and is updated in place."""
+    en_files = existing.get('en', set())
+    for lang, files in existing.items():
+        if lang == 'en':
+            continue
+        for relative_path in sorted(en_files - files):
+            lang_file = LOCALES_DIR / lang / relative_path
+            save_json(lang_file, {})
+            logging.info(f"Created new file {lang_file} for language {lang}")
+        files |= en_files
+
+
+# --------------------------------------------------------------------------------
+# FUNCTION: Translate the pending keys of one language file.
+# Optimization: Only update keys whose English source changed since they were
+# last translated. Each xx/file.json has an xx/file.json.src sidecar mapping
+# key -> hash of the English value it was translated from.
+# --------------------------------------------------------------------------------
+def source_hash(value):
+    """Short, stable digest of an English source string."""
+    return hashlib.blake2b(value.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def source_map_path(lang_file):
+    return lang_file.with_name(lang_file.name + '.src')
+
+
+def _plan_language_update(lang_file, en_content, keys):
+    """Blocking half of update_language: read the sidecar (and the locale file
+       only if something is stale) and work out which keys need translating.
+       Explicitly requested keys are always retranslated.
+       Returns None when the file is up to date, else
+       (lang_content, src_map, hashes, pending), having already saved any
+       adopted sidecar entries if nothing needs translating."""
+    src_file = source_map_path(lang_file)
+    src_map = load_json(src_file)
+    if keys is not None:
+        hashes = {
+            key: source_hash(en_content[key])
+            for key in keys if key in en_content
+        }
+        if not hashes:
+            return None
+        return load_json(lang_file), src_map, hashes, list(hashes)
+
+    hashes = {key: source_hash(value) for key, value in en_content.items()}
+    stale = [key for key, digest in hashes.items() if src_map.get(key) != digest]
+    # Steady state: every key is up to date, so the locale file is never read
+    if not stale:
+        return None
+
+    lang_content = load_json(lang_file)
+    pending = []
+    for key in stale:
+        if key in lang_content and key not in src_map:
+            # Translated before sidecars existed: trust it and start tracking
+            src_map[key] = hashes[key]
+        else:
+            pending.append(key)
+    if not pending:
+        save_json(src_file, src_map)
+        return None
+    return lang_content, src_map, hashes, pending
+
+
+def _apply_language_update(lang_file, lang_content, src_map, updates):
+    """Blocking half of update_language: write the translations and the
+       sidecar."""
+    lang_content.update(updates)
+    save_json(lang_file, lang_content)
+    save_json(source_map_path(lang_file), src_map)
+    logging.info(f"Updated keys {list(updates)} in {lang_file}")
+
+
+async def update_language(lang_file, lang, en_content, keys, semaphore):
+    """Translate the given keys, or if keys is None the English keys that are
+       missing in lang_file or whose English source changed, and save the file
+       if anything was updated. File I/O runs in one worker-thread hop before
+       and one after the translation, keeping the event loop free for network
+       I/O."""
+    plan = await asyncio.to_thread(_plan_language_update, lang_file,
+                                   en_content, keys)
+    if plan is None:
+        return
+    lang_content, src_map, hashes, pending = plan
+
+    translations = await translate_many([en_content[key] for key in pending],
+                                        lang, semaphore)
+    for key in pending:
+        src_map[key] = hashes[key]
+    await asyncio.to_thread(_apply_language_update, lang_file, lang_content,
+                            src_map,
+                            dict(zip(pending, translations, strict=True)))
+
+
+async def _update_languages(keys_to_update, concurrency):
+    semaphore = asyncio.Semaphore(concurrency)
+    en_dir = LOCALES_DIR / 'en'
+    existing = scan_locales()
+    all_languages = [lang for lang in existing if lang != 'en']
+
+    # Submit every (file, language) unit up front and collect afterwards, so one
+    # large file or language cannot hold back the others
+    ensure_files_exist_for_all_languages(existing)
+    updates = []
+    for relative_path in sorted(existing.get('en', ())):
+        en_content = load_json(en_dir / relative_path)
+        updates.extend(
+            update_language(LOCALES_DIR / lang / relative_path, lang,
+                            en_content, keys_to_update, semaphore)
+            for lang in all_languages)
+
+    results = await asyncio.gather(*updates, return_exceptions=True)
+    for result in results:
+        if isinstance(result, Exception):
+            logging.error(f"Error updating translations: {result}")
 
 
 # --------------------------------------------------------------------------------
 # FUNCTION: Update all keys in the English files and propagate changes to all languages.
-# Optimization: Only update keys if the content has changed or is missing.
 # --------------------------------------------------------------------------------
 def update_all_keys(concurrency=5):
     """Update all keys in the English files and propagate the changes to all languages."""
-    en_dir = LOCALES_DIR / 'en'
-    all_languages = [
-        d.name for d in LOCALES_DIR.iterdir() if d.is_dir() and d.name != 'en'
-    ]
-
-    for en_file in en_dir.rglob('*.json'):
-        en_content = load_json(en_file)
-        ensure_file_exists_for_all_languages(en_file)
-
-        tasks = []
-        with ThreadPoolExecutor(max_workers=concurrency) as executor:
-            for lang in all_languages:
-                lang_file = LOCALES_DIR / lang / en_file.relative_to(en_dir)
-                lang_content = load_json(lang_file)
-
-                # Only translate missing or changed content
-                def update_language(lang_file=lang_file,
-                                    lang_content=lang_content,
-                                    en_content=en_content,
-                                    lang=lang):
-                    updated = False
-                    for key, value in en_content.items():
-                        if key not in lang_content or lang_content[
-                                key] != value:
-                            lang_content[key] = translate(value, lang)
-                            updated = True
-                    if updated:
-                        save_json(lang_file, lang_content)
-                        logging.info(f"Updated all keys in {lang_file}")
-
-                tasks.append(executor.submit(update_language))
-
-            for future in as_completed(tasks):
-                try:
-                    future.result()
-                except Exception as e:
-                    logging.error(f"Error updating translations: {e}")
+    asyncio.run(_update_languages(None, concurrency))
 
 
 # --------------------------------------------------------------------------------
@@ -165,74 +561,94 @@ def update_all_keys(concurrency=5):
 # --------------------------------------------------------------------------------
 def update_specific_keys(keys_to_update, concurrency=5):
     """Update specific keys in the English files and propagate changes to all languages."""
-    en_dir = LOCALES_DIR / 'en'
-    all_languages = [
-        d.name for d in LOCALES_DIR.iterdir() if d.is_dir() and d.name != 'en'
-    ]
+    asyncio.run(_update_languages(keys_to_update, concurrency))
+
+
+# --------------------------------------------------------------------------------
+# BATCH API: Bootstrapping a language is not latency sensitive, so its strings can
+# go through the OpenAI Batch API (about half the price, results within 24h).
+# --------------------------------------------------------------------------------
+async def prefill_cache_via_batch_api(texts, target_language):
+    """Translate the uncached texts with a single Batch API job and store the
+       results in the translation cache. Anything the job fails to return is
+       left uncached and translated synchronously afterwards."""
+    keys = {
+        text: _cache_key(text, target_language)
+        for text in dict.fromkeys(_normalize(text) for text in texts) if text
+    }
+    cached = _cache_get(list(keys.values()))
+    misses = [text for text, key in keys.items() if key not in cached]
+    if not misses:
+        return
 
-    for en_file in en_dir.rglob('*.json'):
-        en_content = load_json(en_file)
-        ensure_file_exists_for_all_languages(en_file)
-
-        tasks = []
-        with ThreadPoolExecutor(max_workers=concurrency) as executor:
-            for lang in all_languages:
-                lang_file = LOCALES_DIR / lang / en_file.relative_to(en_dir)
-                lang_content = load_json(lang_file)
-
-                # Only translate missing or changed content for specific keys
-                def update_language(lang_file=lang_file,
-                                    lang_content=lang_content,
-                                    en_content=en_content,
-                                    lang=lang,
-                                    keys_to_update=keys_to_update):
-                    updated = False
-                    for key in keys_to_update:
-                        if key in en_content and (key not in lang_content
-                                                  or lang_content[key]
-                                                  != en_content[key]):
-                            lang_content[key] = translate(
-                                en_content[key], lang)
-                            updated = True
-                    if updated:
-                        save_json(lang_file, lang_content)
-                        logging.info(
-                            f"Updated keys {keys_to_update} in {lang_file}")
-
-                tasks.append(executor.submit(update_language))
-
-            for future in as_completed(tasks):
-                try:
-                    future.result()
-                except Exception as e:
-                    logging.error(f"Error updating translations: {e}")
+    logging.info("Translating %d texts for '%s' via the Batch API",
+                 len(misses), target_language)
+    contents = await run_chat_batch(_get_async_client(), [{
+        "model": TRANSLATION_MODEL,
+        "messages": _translate_messages(text, target_language)
+    } for text in misses])
+    _cache_put([(keys[text], content)
+                for text, content in zip(misses, contents, strict=True)
+                if content is not None])
 
 
 # --------------------------------------------------------------------------------
 # FUNCTION: Create a new language folder and populate it with translated content.
 # --------------------------------------------------------------------------------
-def create_new_language(new_language):
-    """Create a new language folder and copy all JSON files from English with translated content."""
+def _save_new_language_file(new_lang_file, new_lang_content, src_map):
+    save_json(new_lang_file, new_lang_content)
+    save_json(source_map_path(new_lang_file), src_map)
+
+
+async def _create_new_language(new_language, concurrency, use_batch_api):
+    semaphore = asyncio.Semaphore(concurrency)
+    new_language_dir = LOCALES_DIR / new_language
+    new_language_dir.mkdir(parents=True)
+    en_dir = LOCALES_DIR / 'en'
+    en_contents = {
+        en_file: load_json(en_file)
+        for en_file in en_dir.rglob('*.json')
+    }
+
+    if use_batch_api:
+        await prefill_cache_via_batch_api([
+            value for en_content in en_contents.values()
+            for value in en_content.values()
+        ], new_language)
+
+    async def create_file(en_file, en_content):
+        new_lang_file = new_language_dir / en_file.relative_to(en_dir)
+        new_lang_content = dict(
+            zip(en_content.keys(),
+                await translate_many(list(en_content.values()), new_language,
+                                     semaphore),
+                strict=True))
+        src_map = {
+            key: source_hash(value)
+            for key, value in en_content.items()
+        }
+        await asyncio.to_thread(_save_new_language_file, new_lang_file,
+                                new_lang_content, src_map)
+        logging.info(
+            f"Created and translated {new_lang_file} for new language '{new_language}'"
+        )
+
+    await asyncio.gather(*(create_file(en_file, en_content)
+                           for en_file, en_content in en_contents.items()))
+
+
+def create_new_language(new_language, concurrency=5, use_batch_api=False):
+    """Create a new language folder and copy all JSON files from English with translated content.
+       With use_batch_api the strings are translated through the OpenAI Batch API,
+       which is cheaper but can take up to 24 hours."""
     new_language_dir = LOCALES_DIR / new_language
     if new_language_dir.exists():
         logging.error(f"Language folder for '{new_language}' already exists.")
         return
 
     try:
-        new_language_dir.mkdir(parents=True)
-        en_dir = LOCALES_DIR / 'en'
-        for en_file in en_dir.rglob('*.json'):
-            new_lang_file = new_language_dir / en_file.relative_to(en_dir)
-            en_content = load_json(en_file)
-            new_lang_content = {
-                key: translate(value, new_language)
-                for key, value in en_content.items()
-            }
-            new_lang_file.parent.mkdir(parents=True, exist_ok=True)
-            save_json(new_lang_file, new_lang_content)
-            logging.info(
-                f"Created and translated {new_lang_file} for new language '{new_language}'"
-            )
+        asyncio.run(
+            _create_new_language(new_language, concurrency, use_batch_api))
     except Exception as e:
         logging.error(f"Error creating new language '{new_language}': {e}")
 
@@ -243,7 +659,7 @@ def create_new_language(new_language):
 def main_menu():
     print("\nTranslation Management Tool")
     print("----------------------------")
-    print("1. Backup translation files")
+    print("1. Backup translation files (hard-linked snapshot)")
     print("2. Restore translation files from backup")
     print("3. Update all keys in all languages")
     print("4. Update specific keys in all languages")
@@ -258,17 +674,24 @@ def main_menu():
         restore_backup()
     elif choice == '3':
         concurrency = input(
-            "Enter number of concurrent threads (default 5): ") or 5
+            "Enter number of concurrent requests (default 5): ") or 5
         update_all_keys(concurrency=int(concurrency))
     elif choice == '4':
         keys = input("Enter keys to update (separate by spaces): ").split()
         concurrency = input(
-            "Enter number of concurrent threads (default 5): ") or 5
+            "Enter number of concurrent requests (default 5): ") or 5
         update_specific_keys(keys_to_update=keys, concurrency=int(concurrency))
     elif choice == '5':
         new_language = input(
             "Enter the new language code (e.g., 'es' for Spanish): ").strip()
-        create_new_language(new_language)
+        concurrency = input(
+            "Enter number of concurrent requests (default 5): ") or 5
+        use_batch_api = input(
+            "Use the OpenAI Batch API (half price, may take hours)? [y/N]: "
+        ).strip().lower() == 'y'
+        create_new_language(new_language,
+                            concurrency=int(concurrency),
+                            use_batch_api=use_batch_api)
     elif choice == '6':
         print("Exiting the program.")
         exit()
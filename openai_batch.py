@@ -0,0 +1,76 @@
+# openai_batch.py
+"""
+Runs chat completion requests as one OpenAI Batch API job. Shared by
+batch_runner (LMPs over many inputs) and manage_tranlsations (bootstrapping a
+language), which only differ in how they build the requests and use the
+answers.
+"""
+
+import asyncio
+import logging
+from typing import List, Optional, Sequence
+
+import orjson
+from openai import AsyncOpenAI
+
+logger = logging.getLogger(__name__)
+
+BATCH_ENDPOINT = "/v1/chat/completions"
+# Polling starts at BATCH_POLL_INTERVAL and backs off up to BATCH_POLL_MAX
+BATCH_POLL_INTERVAL = 10  # seconds
+BATCH_POLL_MAX = 300  # seconds
+_FINAL_STATUSES = ("completed", "failed", "expired", "cancelled")
+
+
+def to_jsonl(bodies: Sequence[dict]) -> bytes:
+    """
+    Returns the Batch API input file for chat completions request bodies.
+    Each request's custom_id is its index in bodies.
+    """
+    return b"\n".join(
+        orjson.dumps({
+            "custom_id": str(i),
+            "method": "POST",
+            "url": BATCH_ENDPOINT,
+            "body": body,
+        }) for i, body in enumerate(bodies))
+
+
+async def run_chat_batch(client: AsyncOpenAI,
+                         bodies: Sequence[dict]) -> List[Optional[str]]:
+    """
+    Submits one Batch API job with a chat completions request per body, waits
+    for it to finish and returns the answers' message content in the same
+    order as bodies. Requests the job failed to answer are None.
+    """
+    contents: List[Optional[str]] = [None] * len(bodies)
+    if not bodies:
+        return contents
+
+    input_file = await client.files.create(file=("batch.jsonl",
+                                                 to_jsonl(bodies)),
+                                           purpose="batch")
+    batch = await client.batches.create(input_file_id=input_file.id,
+                                        endpoint=BATCH_ENDPOINT,
+                                        completion_window="24h")
+    logger.info("Submitted batch %s with %d requests", batch.id, len(bodies))
+    delay = BATCH_POLL_INTERVAL
+    while batch.status not in _FINAL_STATUSES:
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, BATCH_POLL_MAX)
+        batch = await client.batches.retrieve(batch.id)
+    if batch.status != "completed" or not batch.output_file_id:
+        logger.error("Batch %s ended with status %s", batch.id, batch.status)
+        return contents
+
+    output = await client.files.content(batch.output_file_id)
+    for line in output.text.splitlines():
+        result = orjson.loads(line)
+        response = result.get("response")
+        if not response or response.get("status_code") != 200:
+            continue
+        contents[int(result["custom_id"])] = (
+            response["body"]["choices"][0]["message"]["content"])
+    logger.info("Batch %s answered %d of %d requests", batch.id,
+                sum(c is not None for c in contents), len(bodies))
+    return contents
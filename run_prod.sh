@@ -8,4 +8,4 @@ npm run build
 cd ..
 
 # Start FastAPI server in production mode
-uvicorn main:app --host 0.0.0.0 --port 8000
\ No newline at end of file
+uvicorn main:app --host 0.0.0.0 --port 8000 --loop uvloop --http httptools --workers "${WEB_CONCURRENCY:-$(nproc)}"
\ No newline at end of file
@@ -0,0 +1,23 @@
+from languages import lookup_language
+
+
+def test_exact_names_and_codes():
+    assert lookup_language("es") == ("es", "Spanish", "Español")
+    assert lookup_language("  spanish ") == ("es", "Spanish", "Español")
+    assert lookup_language("Deutsch") == ("de", "German", "Deutsch")
+
+
+def test_single_letter_typos():
+    assert lookup_language("Spansh")[0] == "es"
+    assert lookup_language("Frennch")[0] == "fr"
+    assert lookup_language("Gemran")[0] == "de"
+
+
+def test_near_name_collisions_are_not_matched():
+    assert lookup_language("Sorbian") is None
+    assert lookup_language("Romani") is None
+    assert lookup_language("Sami") is None
+
+
+def test_unknown_language():
+    assert lookup_language("Klingon") is None
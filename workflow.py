@@ -1,12 +1,25 @@
 # worflow.py
 from traceback import print_exc
+import asyncio
+import os
+import random
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from difflib import SequenceMatcher
+from functools import lru_cache
+from operator import attrgetter
 import ell
-from typing import List, Optional
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 from ell.types import Message
-from pydantic import BaseModel, Field
-from enum import Enum
-from athena_ohdsi_client import AthenaOHDSIAPI
-import logging, json
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+import aiohttp
+from openai import AsyncOpenAI
+from athena_ohdsi_client import AthenaOHDSIAPI, MedicalConceptsResponse
+from athena_ohdsi_client.async_api_client import AsyncAthenaOHDSIAPI
+from languages import lookup_language
+from llm_cache import TTLCache, cached, make_key
+import logging
+import orjson
 
 # Configure logging
 logging.basicConfig(level=logging.ERROR)
@@ -14,13 +27,19 @@ logger = logging.getLogger(__name__)
 
 
 class LanguageInfo(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     name: str = Field(description="The English name of the language")
     code: str = Field(description="The ISO 639-1 code of the language")
     nativeName: str = Field(description="The native name of the language")
 
 
-# Data models for structured outputs
+# Data models for structured outputs. Models that are never on the request
+# path defer building their validators until first use, so importing this
+# module doesn't pay for them.
 class Concept(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     concept_id: int
     concept_name: str
     vocabulary_id: str
@@ -30,6 +49,8 @@ class Concept(BaseModel):
 
 # Data model for structured output of the table
 class ConceptTable(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     headers: List[str] = [
         "ID", "Code", "Name", "Class", "Standard Concept", "Invalid Reason",
         "Domain", "Vocabulary"
@@ -37,7 +58,11 @@ class ConceptTable(BaseModel):
     rows: List[List[str]]
 
 
+# LLM results are cached and handed to every caller that asks for the same
+# term, so the models they are parsed into are immutable.
 class ConceptTableRow(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     concept_id: int = Field(
         ..., description="The unique identifier for the concept")
     name: str = Field(..., description="The name of the concept")
@@ -49,246 +74,387 @@ class ConceptTableRow(BaseModel):
 
 
 class ConceptResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     concepts: List[ConceptTableRow]
 
 
+_CONCEPT_ROWS = TypeAdapter(List[ConceptTableRow])
+
+
 class SynonymResult(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     synonym: str = Field(description="A synonym for the given term")
     relevance: float = Field(
         description="The relevance score of the synonym, between 0 and 1")
 
 
 class SynonymResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     synonyms: List[SynonymResult] = Field(
         description="List of synonyms with their relevance scores")
 
 
-# LMP for generating synonyms
-@ell.complex(model="gpt-4o-mini",
-             temperature=0.7,
-             response_format=SynonymResponse)
-def generate_synonyms_old(term: str, language: str, context: str) -> List[Message]:
-    """
-    Generate contextually relevant and medically accurate synonyms for a given medical term in the specified language.
-    Each synonym will include a relevance score from 0 to 1, where 1 represents the highest relevance.
-    """
-    return [
-        ell.system(
-            f"""You are a medical language expert tasked with generating synonyms for a medical term. 
-            The synonyms should be specific to the medical context and language provided. Follow these instructions:
-
-            1. Generate up to 5 synonyms for the term '{term}' based on the provided medical context '{context}' in the language '{language}'.
-            2. Ensure all synonyms are appropriate for the specified medical field or condition, avoiding non-medical or overly general terms.
-            3. If the term '{term}' itself is commonly used and relevant in this context, include it as one of the synonyms.
-            4. Each synonym should include a relevance score between 0 and 1. A score of 1 means the synonym is highly relevant to the medical context, and 0 indicates low relevance.
-            5. If there are limited appropriate synonyms due to the specificity of the term, provide fewer than 5 and ensure they are medically precise.
-            6. Avoid overly broad or non-specialized terms that could create confusion in the context of '{context}'."""
-        ),
-        ell.user(
-            f"Generate up to 5 medical synonyms for the term '{term}' in the context of '{context}' and the language '{language}', with relevance scores for each."
-        )
-    ]
+class TermSynonyms(BaseModel):
+    model_config = ConfigDict(frozen=True, defer_build=True)
 
+    term: str = Field(description="The input term, exactly as given")
+    synonyms: List[SynonymResult] = Field(
+        description="List of synonyms with their relevance scores")
 
-# LMP for concept disambiguation
-@ell.complex(model="gpt-4o-mini", temperature=0.7)
-def disambiguate(term: str, language: str = "en") -> str:
-    """
-    Return a list of possible meanings of a medical term, formatted as a JSON structure.
-    Each meaning includes definition, usage, and medical context.
-    The results will be in the specified language, defaulting to English if not specified.
-    Returns all valid medical interpretations of the exact term, regardless of number.
-    """
-    return [
-        ell.system(
-            f"""You will be asked to explain a potentially ambiguous medical term in a specified language, either provided by the user or chosen by the assistant.
 
-            Follow these steps:
-            1. Identify ALL distinct medical meanings of the exact term provided.
-            2. Include every valid medical interpretation, whether there are 2, 3, or more meanings.
-            3. Keep the term exactly the same across all interpretations.
-            4. Do not break down composite terms into components.
-            5. Do not create entries for related terms or components.
-            6. Only include medical-related meanings of the exact term.
+class SynonymBatchResponse(BaseModel):
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
+    results: List[TermSynonyms] = Field(
+        description="One entry per input term, in input order")
+
+
+# Translating a single term is simple enough for the smallest model, which
+# answers several times faster than gpt-4o-mini.
+TRANSLATE_MODEL = os.getenv("TRANSLATE_MODEL", "gpt-4.1-nano")
+
+# Completion token caps per LMP, a few times the longest expected answer, so
+# a model that starts rambling is cut off instead of stretching tail latency.
+MAX_TOKENS = {
+    "translate": 64,
+    "get_language_info": 100,
+    "generate_synonyms": 512,
+    "generate_synonyms_batch": 8192,
+    "disambiguate": 1500,
+    "concept_lookup": 2000,
+    "format_concept_table": 1500,
+}
 
-            Examples of proper disambiguation with multiple meanings:
+# Fixed sampling seed for the temperature 0 LMPs, so the same prompt gets the
+# same answer and caching it is safe
+LLM_SEED = 42
 
-            French "Crise":
+# Part of the persistent cache keys of the LLM calls below. Bump it whenever a
+# prompt, model or sampling setting changes so stale answers aren't served.
+PROMPT_VERSION = "v2"
+
+
+# One worked disambiguation example per language. The prompt only carries the
+# example for the requested language (or the French one as a default), which
+# keeps two thirds of the example tokens out of every request.
+_DISAMBIGUATE_EXAMPLES = {
+    "fr": """French "Crise":
             [
-              {{
+              {
                 "term": "Crise",
                 "definition": "Episode d'activité cérébrale anormale (crise d'épilepsie)",
                 "usage": "Utilisé pour décrire une manifestation soudaine de l'épilepsie",
                 "context": "Neurologie, où l'on traite les troubles neurologiques",
                 "category": "Episode aigu"
-              }},
-              {{
+              },
+              {
                 "term": "Crise",
                 "definition": "Episode aigu d'anxiété ou de panique (crise d'angoisse)",
                 "usage": "Utilisé pour décrire un épisode intense d'anxiété",
                 "context": "Psychiatrie, où l'on traite les troubles mentaux",
                 "category": "Episode aigu"
-              }},
-              {{
+              },
+              {
                 "term": "Crise",
                 "definition": "Attaque cardiaque soudaine (crise cardiaque)",
                 "usage": "Utilisé pour décrire un événement cardiovasculaire aigu",
                 "context": "Cardiologie, où l'on traite les maladies du cœur",
                 "category": "Episode aigu"
-              }},
-              {{
+              },
+              {
                 "term": "Crise",
                 "definition": "Episode aigu d'asthme (crise d'asthme)",
                 "usage": "Utilisé pour décrire une difficulté respiratoire aiguë",
                 "context": "Pneumologie, où l'on traite les maladies respiratoires",
                 "category": "Episode aigu"
-              }}
-            ]
-
-            Spanish "Ataque":
+              }
+            ]""",
+    "es": """Spanish "Ataque":
             [
-              {{
+              {
                 "term": "Ataque",
                 "definition": "Episodio agudo de origen cardíaco (ataque cardíaco)",
                 "usage": "Se utiliza para describir un infarto de miocardio",
                 "context": "Cardiología, donde se tratan enfermedades del corazón",
                 "category": "Emergencia médica"
-              }},
-              {{
+              },
+              {
                 "term": "Ataque",
                 "definition": "Episodio convulsivo (ataque epiléptico)",
                 "usage": "Se utiliza para describir una crisis epiléptica",
                 "context": "Neurología, donde se tratan trastornos neurológicos",
                 "category": "Episodio agudo"
-              }},
-              {{
+              },
+              {
                 "term": "Ataque",
                 "definition": "Episodio agudo de ansiedad (ataque de pánico)",
                 "usage": "Se utiliza para describir una crisis de ansiedad severa",
                 "context": "Psiquiatría, donde se tratan trastornos mentales",
                 "category": "Episodio agudo"
-              }}
-            ]
-
-            German "Schock":
+              }
+            ]""",
+    "de": """German "Schock":
             [
-              {{
+              {
                 "term": "Schock",
                 "definition": "Akutes Kreislaufversagen (kardiogener Schock)",
                 "usage": "Beschreibt einen lebensbedrohlichen Zustand mit Herzversagen",
                 "context": "Kardiologie und Notfallmedizin",
                 "category": "Akutzustand"
-              }},
-              {{
+              },
+              {
                 "term": "Schock",
                 "definition": "Psychische Reaktion auf ein Trauma (psychischer Schock)",
                 "usage": "Beschreibt eine akute Stressreaktion",
                 "context": "Psychiatrie und Psychologie",
                 "category": "Psychischer Zustand"
-              }},
-              {{
+              },
+              {
                 "term": "Schock",
                 "definition": "Allergische Reaktion (anaphylaktischer Schock)",
                 "usage": "Beschreibt eine schwere allergische Reaktion",
                 "context": "Allergologie und Notfallmedizin",
                 "category": "Akutzustand"
-              }}
-            ]
+              }
+            ]""",
+}
+
+
+# The static part of the disambiguation system prompt. It comes first and
+# holds no per-call text, so every request shares it as a byte-identical
+# prefix that OpenAI's prompt caching can reuse.
+_DISAMBIGUATE_INSTRUCTIONS = """You will be asked to explain a potentially ambiguous medical term in a specified language, either provided by the user or chosen by the assistant.
+
+            Follow these steps:
+            1. Identify ALL distinct medical meanings of the exact term provided.
+            2. Include every valid medical interpretation, whether there are 2, 3, or more meanings.
+            3. Keep the term exactly the same across all interpretations.
+            4. Do not break down composite terms into components.
+            5. Do not create entries for related terms or components.
+            6. Only include medical-related meanings of the exact term.
 
-            Your output should be formatted as a JSON array of objects, with each object representing a distinct meaning of the exact same term:
+            Your output should be formatted as a JSON array of objects, with each object representing a distinct meaning of the exact same term, written in the requested language:
 
             ```json
             [
-              {{
-                "term": "<The exact medical term>",
-                "definition": "<First meaning of the term in {language}>",
-                "usage": "<How the term is used in this meaning in {language}>",
-                "context": "<Medical context for this meaning in {language}>",
-                "category": "<Category for this meaning in {language}>"
-              }},
-              {{
-                "term": "<The exact same medical term>",
-                "definition": "<Second meaning of the term in {language}>",
-                "usage": "<How the term is used in this meaning in {language}>",
-                "context": "<Medical context for this meaning in {language}>",
-                "category": "<Category for this meaning in {language}>"
-              }},
-              {{
-                "term": "<The exact same medical term>",
-                "definition": "<Third meaning of the term in {language}>",
-                "usage": "<How the term is used in this meaning in {language}>",
-                "context": "<Medical context for this meaning in {language}>",
-                "category": "<Category for this meaning in {language}>"
-              }}
-              ... additional meanings as needed ...
+              {
+                "term": "<The exact medical term, the same in every object>",
+                "definition": "<This meaning of the term>",
+                "usage": "<How the term is used in this meaning>",
+                "context": "<Medical context for this meaning>",
+                "category": "<Category for this meaning>"
+              },
+              ... one object per additional meaning ...
             ]
             ```
-            """),
+
+            Example of proper disambiguation with multiple meanings:
+
+            """
+
+
+# Only the trailing example varies (by language), so each rendered variant is
+# built once and reused.
+@lru_cache(maxsize=64)
+def _disambiguate_system_prompt(language: str) -> str:
+    entry = lookup_language(language)
+    examples = _DISAMBIGUATE_EXAMPLES.get(entry[0] if entry else None,
+                                          _DISAMBIGUATE_EXAMPLES["fr"])
+    return _DISAMBIGUATE_INSTRUCTIONS + examples + "\n"
+
+
+# LMP for concept disambiguation
+@ell.complex(model="gpt-4o-mini",
+             temperature=0.0,
+             seed=LLM_SEED,
+             max_tokens=MAX_TOKENS["disambiguate"])
+def disambiguate(term: str, language: str = "en") -> str:
+    """
+    Return a list of possible meanings of a medical term, formatted as a JSON structure.
+    Each meaning includes definition, usage, and medical context.
+    The results will be in the specified language, defaulting to English if not specified.
+    Returns all valid medical interpretations of the exact term, regardless of number.
+    Deterministic: the same term and language give the same answer.
+    """
+    return [
+        ell.system(_disambiguate_system_prompt(language)),
         ell.user(
             f"Disambiguate the following medical term in {language}: {term}")
     ]
 
 
+# Concept search payloads for the no-result and error paths, serialised once.
+# Kept in orjson's compact form so they match the other payloads built here.
+_EMPTY_RESULT = '{"error":"No concepts found."}'
+_NO_CONCEPTS = '{"concepts":[]}'
+_ERROR_TEMPLATE = '{"error":%s}'
+
+
+def _error_json(message: str) -> str:
+    """
+    Returns the concept search error payload for message.
+    """
+    return _ERROR_TEMPLATE % orjson.dumps(message).decode()
+
+
+# Athena search results by normalised query, for the sync search path (the
+# async one caches through @cached). Athena content changes rarely.
+_athena_cache = TTLCache(maxsize=4096, ttl=24 * 3600)
+
+# Concepts per Athena search page. Enough candidates for _top_concepts to
+# rank; callers needing fewer can ask for smaller pages.
+ATHENA_PAGE_SIZE = 20
+
+
+@lru_cache(maxsize=1)
+def _get_athena() -> AthenaOHDSIAPI:
+    """
+    Returns the process-wide Athena client, so its requests session keeps
+    connections alive between lookups.
+    """
+    return AthenaOHDSIAPI()
+
 
 # Main function for finding OMOP concept (not an LMP)
 def find_omop_concept(
     chosen_term: str,
     language: str = "en",
     synonyms: Optional[List[str]] = None,
+    max_rows: Optional[int] = None,
+    page_size: int = ATHENA_PAGE_SIZE,
 ) -> str:  # Returns a JSON string
     """
     Finds the OMOP standard concept ID for a given medical term by directly calling Athena and returns a JSON string.
+    page_size caps how many concepts Athena returns.
+    With max_rows, only the best matching concepts (see _top_concepts) are kept.
     """
-    logger.debug(
-        f"Starting find_omop_concept with term: {chosen_term}, synonyms: {synonyms}"
-    )
-
-    with AthenaOHDSIAPI() as api_client:
-        try:
-            # Construct the query string
-            query = chosen_term
-            if synonyms:
-                query += " OR " + " OR ".join(synonyms)
+    logger.debug("Starting find_omop_concept with term: %s, synonyms: %s",
+                 chosen_term, synonyms)
 
-            logger.debug(f"Constructed query: {query}")
+    api_client = _get_athena()
+    try:
+        query = _build_concept_query(chosen_term, synonyms)
+        logger.debug("Constructed query: %s", query)
 
-            # Call the API
+        # Repeated queries are served from the cache; failures raise below
+        # and are never cached
+        key = make_key(query, page_size)
+        response = _athena_cache.get(key)
+        if response is None:
             logger.debug("Calling Athena API...")
             response = api_client.get_medical_concepts(
                 query=query,
-                page_size=20,  # Adjust as needed
+                page_size=page_size,
             )
+            _athena_cache.set(key, response)
+        return _concepts_to_json(response, chosen_term, max_rows)
 
-            if not response or not hasattr(response, "content"):
-                logger.error("No valid content returned from Athena API.")
-                return json.dumps({"error": "No concepts found."
-                                   })  # Return JSON error message
-
-            logger.debug("Athena API call successful.")
-
-            # Convert the response to ConceptTableRow objects and then to a list of dictionaries
-            concept_table_rows = [
-                ConceptTableRow(
-                    concept_id=concept.id,
-                    name=concept.name,
-                    domain=concept.domain,
-                    vocabulary=concept.vocabulary,
-                    standard_concept=concept.standardConcept,
-                ).model_dump()  # Convert to dictionary
-                for concept in response.content
-            ]
+    except Exception as e:
+        logger.exception("Error calling Athena API: %s", e)
+        return _error_json(str(e))  # Return JSON error message
 
-            # Create the ConceptResponse dictionary
-            concept_response = {"concepts": concept_table_rows}
 
-            return json.dumps(concept_response, indent=2)  # Return JSON string
+# Extra OR clauses rarely improve Athena recall past this point but each one
+# adds server-side scan cost and query-string length.
+MAX_QUERY_SYNONYMS = 8
 
-        except Exception as e:
-            logger.exception(f"Error calling Athena API: {e}")
-            return json.dumps({"error": str(e)})  # Return JSON error message
 
+def _build_concept_query(chosen_term: str,
+                         synonyms: Optional[List[str]] = None) -> str:
+    """
+    Builds the Athena query string for a term and its optional synonyms.
+    Synonyms repeating the term or each other (ignoring case and spacing) are
+    dropped, and at most MAX_QUERY_SYNONYMS are kept.
+    """
+    terms = {" ".join(chosen_term.split()).casefold(): chosen_term}
+    for synonym in synonyms or ():
+        if len(terms) > MAX_QUERY_SYNONYMS:
+            break
+        terms.setdefault(" ".join(synonym.split()).casefold(), synonym)
+    return " OR ".join(terms.values())
 
-@ell.complex(model="gpt-4o-mini")
+
+def _concepts_to_json(response,
+                      term: Optional[str] = None,
+                      max_rows: Optional[int] = None) -> str:
+    """
+    Converts an Athena concepts response into the JSON string handed to the
+    concept lookup LMP, keeping the max_rows best matches for term if given.
+    """
+    if not response or not hasattr(response, "content"):
+        logger.error("No valid content returned from Athena API.")
+        return _EMPTY_RESULT  # Return JSON error message
+
+    logger.debug("Athena API call successful.")
+    if not response.content:
+        return _NO_CONCEPTS
+
+    # Compact JSON {"concepts": [...]} straight from plain dicts: it is only
+    # read by the LLM, so neither models, indentation nor null fields are
+    # worth the tokens
+    return orjson.dumps({
+        "concepts": [{
+            field: value
+            for field, value in row.items() if value is not None
+        } for row in _concept_rows(
+            _top_concepts(response.content, term, max_rows)
+            if max_rows else response.content)]
+    }).decode()  # Return JSON string
+
+
+_ROW_FIELDS = ("concept_id", "name", "domain", "vocabulary",
+               "standard_concept")
+_concept_fields = attrgetter("id", "name", "domain", "vocabulary",
+                             "standardConcept")
+
+
+def _concept_rows(concepts) -> List[dict]:
+    """
+    Maps Athena concepts to ConceptTableRow fields.
+    """
+    return [
+        dict(zip(_ROW_FIELDS, fields, strict=True))
+        for fields in map(_concept_fields, concepts)
+    ]
+
+
+def _table_rows(concepts) -> List[ConceptTableRow]:
+    """
+    Validates Athena concepts as ConceptTableRows. Athena leaves domain,
+    vocabulary and standardConcept null on some concepts; those become empty
+    strings, as the concept lookup LMP returns them.
+    """
+    return _CONCEPT_ROWS.validate_python([{
+        field: "" if value is None else value
+        for field, value in row.items()
+    } for row in _concept_rows(concepts)])
+
+
+# Rows handed to (and so generated by) the concept lookup LMP. Output tokens
+# dominate its latency, so only the best Athena matches are sent.
+CONCEPT_LOOKUP_MAX_ROWS = int(os.getenv("CONCEPT_LOOKUP_MAX_ROWS", "10"))
+
+
+def _top_concepts(concepts, term: str, limit: int) -> list:
+    """
+    Returns the limit concepts best matching term: standard concepts first,
+    then by how closely their name matches the term.
+    """
+    term = _normalize_term(term)
+
+    def rank(concept):
+        similarity = SequenceMatcher(None, term,
+                                     concept.name.casefold()).ratio()
+        return (concept.standardConcept not in ("S", "Standard"), -similarity)
+
+    return sorted(concepts, key=rank)[:limit]
+
+
+@ell.complex(model="gpt-4o-mini",
+             max_tokens=MAX_TOKENS["format_concept_table"])
 def format_concept_table(concepts_json: str):
 
     return [
@@ -304,7 +470,25 @@ vocabulary"""),
     ]
 
 
-@ell.simple(model="gpt-4o-mini", temperature=0.0)
+# The term, context and language are all in the user message, so the system
+# prompt is the same for every translation.
+_TRANSLATE_SYSTEM = """You are a medical language expert. Your task is to translate medical terms while considering the specific medical context provided.
+
+            1. Translate the term into the requested language.
+            2. The translation must be contextually accurate according to the given medical context.
+            3. Only provide the translated term, ensuring that it aligns with the medical usage in the specified context.
+            4. Do not provide any additional explanations or responses beyond the translated term.
+
+            Example format:
+            "<translated term>"
+            """
+
+
+# Deterministic (temperature 0), so repeated translations are served from memory
+@lru_cache(maxsize=1024)
+@ell.simple(model=TRANSLATE_MODEL,
+            temperature=0.0,
+            max_tokens=MAX_TOKENS["translate"])
 def translate(term: str, context: str, language: str = "en") -> str:
     """
     Translates the given medical term or synonym into the specified language, taking the provided medical context into account.
@@ -312,63 +496,150 @@ def translate(term: str, context: str, language: str = "en") -> str:
     Only respond with the translated term and nothing else.
     """
     return [
-        ell.system(
-            f"""You are a medical language expert. Your task is to translate medical terms while considering the specific medical context provided.
-
-            1. Translate the term '{term}' into the language '{language}'.
-            2. The translation must be contextually accurate according to the medical context: '{context}'.
-            3. Only provide the translated term, ensuring that it aligns with the medical usage in the specified context.
-            4. Do not provide any additional explanations or responses beyond the translated term.
-
-            Example format:
-            "<translated term>"
-            """),
+        ell.system(_TRANSLATE_SYSTEM),
         ell.user(
             f"Translate the term '{term}' considering the medical context '{context}' into the language '{language}'."
         )
     ]
 
 
+_ENGLISH = {"en", "eng", "english"}
+
+
+def _is_english(language: str) -> bool:
+    """
+    True for English language codes/names ("en", "en-US", "English", ...).
+    """
+    language = language.strip().lower()
+    return language in _ENGLISH or language.startswith("en-")
+
+
 @ell.complex(
     model="gpt-4o-mini",
-    response_format=ConceptResponse)  # Use complex for structured output
+    response_format=ConceptResponse,  # Use complex for structured output
+    max_tokens=MAX_TOKENS["concept_lookup"])
 def concept_lookup(term: str,
                    context: str,
                    language: str = "en") -> List[Message]:
     """
     Looks up a medical term in the OMOP database and returns structured concept information.
+    As in aconcept_lookup, the untranslated term is searched while the
+    translation runs, and that result is used if the translation comes back
+    unchanged.
     """
-    string_to_search = translate(term, context, "english")
-    logger.debug(f"Received term: {term}, language: {language}")
-    print(f"EL string tosearthc:::: {string_to_search}")
-    concepts_json = find_omop_concept(string_to_search, language)
+    if _is_english(language):
+        string_to_search = term
+        concepts_json = find_omop_concept(term,
+                                          language,
+                                          max_rows=CONCEPT_LOOKUP_MAX_ROWS)
+    else:
+        speculative = _search_executor().submit(
+            find_omop_concept, term, language,
+            max_rows=CONCEPT_LOOKUP_MAX_ROWS)
+        string_to_search = translate(term, context, "english")
+        concepts_json = speculative.result()
+        if not _same_term(string_to_search, term):
+            concepts_json = find_omop_concept(string_to_search,
+                                              language,
+                                              max_rows=CONCEPT_LOOKUP_MAX_ROWS)
+    logger.debug("Received term: %s, language: %s, searching for: %s", term,
+                 language, string_to_search)
+    return _concept_lookup_messages(concepts_json, language)
 
-    try:
-        # Attempt to parse the JSON. If it's an error, send it to the LMP to handle.
-        json.loads(concepts_json)
-        return [
-            ell.system(f"""You are a medical information retrieval system. 
+
+@lru_cache(maxsize=1)
+def _search_executor() -> ThreadPoolExecutor:
+    """
+    Returns the thread pool that runs speculative Athena searches for the
+    sync concept_lookup.
+    """
+    return ThreadPoolExecutor(max_workers=8,
+                              thread_name_prefix="athena-search")
+
+
+# The language comes last, so every lookup shares the instructions as a prompt
+# prefix OpenAI can cache.
+_CONCEPT_LOOKUP_INSTRUCTIONS = """You are a medical information retrieval system. 
                 You receive a JSON string containing medical concepts or an error message.
-                If the input is valid concept data, translate the 'name', 'domain', 'vocabulary', and 'standardConcept' fields into {language} and then
+                If the input is valid concept data, translate the 'name', 'domain', 'vocabulary', and 'standardConcept' fields into the target language given below and then
                 return the concepts as a structured list of ConceptTableRow objects. 
                 If the input is an error message or no concepts are found, return an empty list, but still structure your response
-                as a valid ConceptResponse.  Ensure all fields of ConceptResponse and ConceptTableRow are present, even if empty."""
-                       ),
-            ell.user(concepts_json)
-        ]
-    except json.JSONDecodeError:
-        # If JSON parsing fails (likely an error message), handle it gracefully.
+                as a valid ConceptResponse.  Ensure all fields of ConceptResponse and ConceptTableRow are present, even if empty.
+
+                Target language: """
+
+
+@lru_cache(maxsize=64)
+def _concept_lookup_system_prompt(language: str) -> str:
+    """
+    Builds the concept lookup system prompt; memoized per language.
+    """
+    return _CONCEPT_LOOKUP_INSTRUCTIONS + language
+
+
+def _concept_lookup_messages(concepts_json: str,
+                             language: str) -> List[Message]:
+    """
+    Builds the prompt that turns Athena concept JSON into a ConceptResponse.
+    """
+    if _is_json_payload(concepts_json):
+        # Valid concept data or a JSON error: send it to the LMP to handle.
         return [
-            ell.system(
-                "You are a medical information retrieval system. You sometimes receive error messages instead of concept data. If you receive an error, return an empty list of concepts."
-            ),
+            ell.system(_concept_lookup_system_prompt(language)),
             ell.user(concepts_json)
         ]
+    # If the input is not JSON (likely an error message), handle it gracefully.
+    return [
+        ell.system(
+            "You are a medical information retrieval system. You sometimes receive error messages instead of concept data. If you receive an error, return an empty list of concepts."
+        ),
+        ell.user(concepts_json)
+    ]
 
 
+def _is_json_payload(concepts_json: str) -> bool:
+    """
+    True if concepts_json is valid JSON. The payloads built in this module
+    are recognised by their prefix without parsing; anything else is parsed.
+    """
+    if concepts_json.startswith(('{"concepts":', '{"error":')):
+        return True
+    try:
+        orjson.loads(concepts_json)
+        return True
+    except orjson.JSONDecodeError:
+        return False
+
+
+def _has_concepts(concepts_json: str) -> bool:
+    """
+    True if a search payload holds at least one concept. For anything else
+    (an error, no concepts, non-JSON) the concept lookup LMP can only answer
+    with an empty list, so callers skip it.
+    """
+    return (concepts_json.startswith('{"concepts":')
+            and concepts_json != _NO_CONCEPTS)
+
+
+def lookup_language_info(input_text: str) -> Optional[LanguageInfo]:
+    """
+    Resolves common languages from the static ISO 639-1 table without an LLM
+    call. Returns None when get_language_info is needed.
+    """
+    entry = lookup_language(input_text)
+    if entry is None:
+        return None
+    code, name, native_name = entry
+    return LanguageInfo(name=name, code=code, nativeName=native_name)
+
+
+# Language lookups are deterministic (temperature 0) and drawn from a small set
+# of inputs, so each worker process keeps the answers in memory.
+@lru_cache(maxsize=1024)
 @ell.complex(model="gpt-4o-mini",
              temperature=0.0,
-             response_format=LanguageInfo)
+             response_format=LanguageInfo,
+             max_tokens=MAX_TOKENS["get_language_info"])
 def get_language_info(input_text: str) -> List[Message]:
     return [
         ell.system("""
@@ -401,27 +672,18 @@ def get_language_info(input_text: str) -> List[Message]:
     ]
 
 
-@ell.complex(model="gpt-4o-mini",
-     temperature=0.7,
-     response_format=SynonymResponse)
-def generate_synonyms(term: str, language: str, context: str) -> List[Message]:
-    """
-    Generate contextually relevant and medically accurate synonyms for a given medical term in the specified language.
-    The original term is always included as one of the synonyms with relevance 1.0.
-    Only includes closely related medical synonyms specific to the provided context.
-    Each synonym includes a relevance score from 0 to 1, where 1 represents the highest relevance.
-    """
-    return [
-    ell.system(
-        f"""You are a medical language expert tasked with generating synonyms for a medical term.
+# The synonym system prompt holds no per-call text (the term, language and
+# context are in the user message), so every request shares it as a
+# byte-identical prefix that OpenAI's prompt caching can reuse.
+_SYNONYMS_SYSTEM = """You are a medical language expert tasked with generating synonyms for a medical term.
         Follow these strict guidelines:
     
-        1. ALWAYS include the exact term '{term}' as the first synonym with a relevance score of 1.0.
+        1. ALWAYS include the exact term as the first synonym with a relevance score of 1.0.
     
         2. Generate ONLY synonyms that are:
            - Strictly medical in nature
-           - Specific to the provided context '{context}'
-           - Commonly used in the specified language '{language}'
+           - Specific to the provided context
+           - Commonly used in the specified language
            - Very closely related in meaning
     
         3. Limit additional synonyms to a maximum of 4 (plus the original term).
@@ -441,36 +703,646 @@ def generate_synonyms(term: str, language: str, context: str) -> List[Message]:
         Examples:
     
         Input: term="acute respiratory infection", language="en", context="respiratory disease"
-        {{
+        {
           "synonyms": [
-            {{"synonym": "acute respiratory infection", "relevance": 1.0}},
-            {{"synonym": "acute respiratory tract infection", "relevance": 0.95}},
-            {{"synonym": "acute respiratory illness", "relevance": 0.90}}
+            {"synonym": "acute respiratory infection", "relevance": 1.0},
+            {"synonym": "acute respiratory tract infection", "relevance": 0.95},
+            {"synonym": "acute respiratory illness", "relevance": 0.90}
           ]
-        }}
+        }
     
         Input: term="hipertensión", language="es", context="cardiología"
-        {{
+        {
           "synonyms": [
-            {{"synonym": "hipertensión", "relevance": 1.0}},
-            {{"synonym": "hipertensión arterial", "relevance": 0.95}},
-            {{"synonym": "presión arterial alta", "relevance": 0.90}},
-            {{"synonym": "HTA", "relevance": 0.85}}
+            {"synonym": "hipertensión", "relevance": 1.0},
+            {"synonym": "hipertensión arterial", "relevance": 0.95},
+            {"synonym": "presión arterial alta", "relevance": 0.90},
+            {"synonym": "HTA", "relevance": 0.85}
           ]
-        }}
+        }
     
         Input: term="migräne", language="de", context="neurologie"
-        {{
+        {
           "synonyms": [
-            {{"synonym": "migräne", "relevance": 1.0}},
-            {{"synonym": "migränekopfschmerz", "relevance": 0.95}},
-            {{"synonym": "hemikranie", "relevance": 0.85}}
+            {"synonym": "migräne", "relevance": 1.0},
+            {"synonym": "migränekopfschmerz", "relevance": 0.95},
+            {"synonym": "hemikranie", "relevance": 0.85}
           ]
-        }}
+        }
     
         Consider only the provided term, language, and context when generating synonyms. Ensure all synonyms are valid medical terms that preserve the exact medical meaning specified in the context."""
-    ),
+
+
+@ell.complex(model="gpt-4o-mini",
+     temperature=0.0,
+     seed=LLM_SEED,
+     response_format=SynonymResponse,
+     max_tokens=MAX_TOKENS["generate_synonyms"])
+def generate_synonyms(term: str, language: str, context: str) -> List[Message]:
+    """
+    Generate contextually relevant and medically accurate synonyms for a given medical term in the specified language.
+    The original term is always included as one of the synonyms with relevance 1.0.
+    Only includes closely related medical synonyms specific to the provided context.
+    Each synonym includes a relevance score from 0 to 1, where 1 represents the highest relevance.
+    Deterministic: the same term, language and context give the same answer.
+    """
+    return [
+    ell.system(_SYNONYMS_SYSTEM),
     ell.user(
         f"Generate medical synonyms for the term '{term}' in the context of '{context}' and the language '{language}', ensuring to include the exact term and only closely related medical synonyms specific to this context."
     )
-    ]
\ No newline at end of file
+    ]
+
+
+# Terms per generate_synonyms_batch call: enough to amortise the long system
+# prompt, few enough that the answers fit its token cap.
+SYNONYM_BATCH_SIZE = 16
+
+
+# The single-term guidelines, applied to each term of a numbered list
+_SYNONYMS_BATCH_SYSTEM = _SYNONYMS_SYSTEM + """
+
+        You will receive a numbered list of terms instead of a single term. Apply the guidelines above to each term separately and return one result per term in the same order, each giving the exact input term and its synonyms."""
+
+
+@ell.complex(model="gpt-4o-mini",
+             temperature=0.0,
+             seed=LLM_SEED,
+             response_format=SynonymBatchResponse,
+             max_tokens=MAX_TOKENS["generate_synonyms_batch"])
+def generate_synonyms_batch(terms: List[str], language: str,
+                            context: str) -> List[Message]:
+    """
+    Batch variant of generate_synonyms: synonyms for several terms sharing a
+    language and context in one call, so the instructions are sent once.
+    """
+    numbered = "\n".join(f"{i}. {term}" for i, term in enumerate(terms, 1))
+    return [
+        ell.system(_SYNONYMS_BATCH_SYSTEM),
+        ell.user(
+            f"Generate medical synonyms for each of these terms in the context of '{context}' and the language '{language}':\n{numbered}"
+        )
+    ]
+
+
+# Async variants of the LMPs above. They send the same prompts through the
+# OpenAI async client so callers on an event loop don't tie up a thread per
+# LLM round-trip, and return the parsed payload instead of an ell Message.
+
+
+# Caps on concurrent outbound calls, so gather-heavy paths stay below the
+# providers' rate limits instead of tripping 429s and serialising on retries.
+OPENAI_CONCURRENCY = int(os.getenv("OPENAI_CONCURRENCY", "16"))
+OPENAI_MAX_RETRIES = int(os.getenv("OPENAI_MAX_RETRIES", "4"))
+ATHENA_CONCURRENCY = int(os.getenv("ATHENA_CONCURRENCY", "8"))
+ATHENA_MAX_ATTEMPTS = 4
+
+
+# A contended asyncio.Semaphore binds to the loop it is first used on, so each
+# event loop (e.g. each asyncio.run in run_concept_lookups) gets its own pair,
+# kept for as long as the loop itself exists.
+_Semaphores = Tuple[asyncio.Semaphore, asyncio.Semaphore]
+_loop_semaphores: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, _Semaphores] = weakref.WeakKeyDictionary()
+
+
+def _semaphores() -> _Semaphores:
+    """
+    Returns the (OpenAI, Athena) concurrency semaphores for the running loop.
+    """
+    loop = asyncio.get_running_loop()
+    semaphores = _loop_semaphores.get(loop)
+    if semaphores is None:
+        semaphores = (asyncio.Semaphore(OPENAI_CONCURRENCY),
+                      asyncio.Semaphore(ATHENA_CONCURRENCY))
+        _loop_semaphores[loop] = semaphores
+    return semaphores
+
+
+def _openai_semaphore() -> asyncio.Semaphore:
+    return _semaphores()[0]
+
+
+def _athena_semaphore() -> asyncio.Semaphore:
+    return _semaphores()[1]
+
+
+@lru_cache(maxsize=1)
+def _get_async_openai() -> AsyncOpenAI:
+    """
+    Returns the process-wide async OpenAI client, created on first use.
+    The client retries 429s and 5xx responses with exponential backoff.
+    """
+    return AsyncOpenAI(max_retries=OPENAI_MAX_RETRIES)
+
+
+@lru_cache(maxsize=1)
+def _get_async_athena() -> AsyncAthenaOHDSIAPI:
+    """
+    Returns the process-wide async Athena client. Its connection pool is
+    reused across calls so each search skips the TCP and TLS handshakes.
+    """
+    return AsyncAthenaOHDSIAPI()
+
+
+async def aclose_clients() -> None:
+    """
+    Closes the shared clients. Call on shutdown, or before leaving an event
+    loop; later calls create fresh clients.
+    """
+    if _get_athena.cache_info().currsize:
+        _get_athena().close()
+    if _get_async_athena.cache_info().currsize:
+        await _get_async_athena().close()
+    if _get_async_openai.cache_info().currsize:
+        await _get_async_openai().close()
+    _get_athena.cache_clear()
+    _get_async_athena.cache_clear()
+    _get_async_openai.cache_clear()
+
+
+def _to_openai_messages(messages: List[Message]) -> List[dict]:
+    """
+    Converts ell messages to the chat completions message format.
+    """
+    return [{
+        "role": message.role,
+        "content": message.text
+    } for message in messages]
+
+
+async def _acomplete(messages: List[Message],
+                     model: str = "gpt-4o-mini",
+                     **api_params):
+    """
+    Sends ell messages to the chat completions API.
+    Returns the parsed object when a response_format is given, else the text.
+    """
+    client = _get_async_openai()
+    openai_messages = _to_openai_messages(messages)
+    async with _openai_semaphore():
+        if api_params.get("response_format") is not None:
+            completion = await client.beta.chat.completions.parse(
+                model=model, messages=openai_messages, **api_params)
+            return completion.choices[0].message.parsed
+        completion = await client.chat.completions.create(
+            model=model, messages=openai_messages, **api_params)
+    return completion.choices[0].message.content
+
+
+async def _astream(messages: List[Message],
+                   model: str = "gpt-4o-mini",
+                   **api_params) -> AsyncIterator[str]:
+    """
+    Streams the text of a chat completion as it is generated.
+    """
+    client = _get_async_openai()
+    async with _openai_semaphore():
+        stream = await client.chat.completions.create(
+            model=model,
+            messages=_to_openai_messages(messages),
+            stream=True,
+            **api_params)
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
+
+async def _acall_lmp(lmp, *args, model: str = "gpt-4o-mini"):
+    """
+    Runs the prompt body of an ell LMP and completes it asynchronously with
+    the same API parameters the LMP was decorated with.
+    """
+    messages = lmp.__ell_func__(*args)
+    return await _acomplete(messages, model=model,
+                            **lmp.__ell_api_params__)
+
+
+@cached(ttl=24 * 3600,
+        persist=True,
+        version=PROMPT_VERSION,
+        casefold=("language", ))
+async def adisambiguate(term: str,
+                        language: str = "en",
+                        model: str = "gpt-4o-mini") -> str:
+    """
+    Async counterpart of disambiguate. Returns the raw response text.
+    Deterministic, so answers are cached for a day.
+    """
+    return await _acall_lmp(disambiguate, term, language, model=model)
+
+
+def astream_disambiguate(term: str,
+                         language: str = "en",
+                         model: str = "gpt-4o-mini") -> AsyncIterator[str]:
+    """
+    Streams the raw disambiguation response text as the model produces it.
+    """
+    return _astream(disambiguate.__ell_func__(term, language),
+                    model=model,
+                    **disambiguate.__ell_api_params__)
+
+
+def astream_format_concept_table(concepts_json: str) -> AsyncIterator[str]:
+    """
+    Streams the format_concept_table output as the model produces it, so a
+    caller can render table rows before generation finishes.
+    """
+    return _astream(format_concept_table.__ell_func__(concepts_json),
+                    **format_concept_table.__ell_api_params__)
+
+
+async def adisambiguate_models(term: str, language: str,
+                               models: List[str]) -> List[str]:
+    """
+    Runs adisambiguate against several models concurrently.
+    Returns the raw response texts in the same order as models.
+    """
+    return list(await asyncio.gather(
+        *(adisambiguate(term, language, model=model) for model in models)))
+
+
+@cached(ttl=24 * 3600,
+        persist=True,
+        version=PROMPT_VERSION,
+        casefold=("language", "context"))
+async def agenerate_synonyms(term: str, language: str,
+                             context: str) -> SynonymResponse:
+    """
+    Async counterpart of generate_synonyms. Deterministic, so answers are
+    cached for a day.
+    """
+    return await _acall_lmp(generate_synonyms, term, language, context)
+
+
+async def agenerate_synonyms_many(terms: List[str], language: str,
+                                  context: str) -> Dict[str, SynonymResponse]:
+    """
+    Generates synonyms for many terms, SYNONYM_BATCH_SIZE terms per LLM call
+    with the batches running concurrently. Terms a batch fails to answer are
+    retried one by one through agenerate_synonyms.
+    Returns a mapping from each distinct term to its synonyms.
+    """
+    unique_terms = list(dict.fromkeys(terms))
+    batches = [
+        unique_terms[i:i + SYNONYM_BATCH_SIZE]
+        for i in range(0, len(unique_terms), SYNONYM_BATCH_SIZE)
+    ]
+    responses = await asyncio.gather(
+        *(_acall_lmp(generate_synonyms_batch, batch, language, context)
+          for batch in batches),
+        return_exceptions=True)
+
+    by_term = {_normalize_term(term): term for term in unique_terms}
+    results = {}
+    for response in responses:
+        if isinstance(response, Exception):
+            logger.error("Synonym batch failed: %s", response)
+            continue
+        for result in response.results:
+            term = by_term.get(_normalize_term(result.term))
+            if term is not None:
+                results.setdefault(term,
+                                   SynonymResponse(synonyms=result.synonyms))
+
+    missing = [term for term in unique_terms if term not in results]
+    if missing:
+        logger.debug("Generating synonyms one by one for %d terms",
+                     len(missing))
+        results.update(
+            zip(missing,
+                await asyncio.gather(
+                    *(agenerate_synonyms(term, language, context)
+                      for term in missing)),
+                strict=True))
+    return results
+
+
+@cached(ttl=24 * 3600,
+        persist=True,
+        version=PROMPT_VERSION,
+        casefold=("language", "context"))
+async def atranslate(term: str, context: str, language: str = "en") -> str:
+    """
+    Async counterpart of translate. Deterministic (temperature 0), so answers
+    are cached for a day.
+    """
+    return await _acall_lmp(translate,
+                            term,
+                            context,
+                            language,
+                            model=TRANSLATE_MODEL)
+
+
+# Number of Athena result pages to collect per search. Pages after the first
+# (Athena pages are 1-based) are fetched concurrently once the first response
+# reports totalPages.
+ATHENA_MAX_PAGES = int(os.getenv("ATHENA_MAX_PAGES", "1"))
+# Seconds a failed search (after its retries) is answered from memory with the
+# same error, so callers don't pile more attempts onto a struggling Athena
+ATHENA_ERROR_TTL = 5
+
+
+def _is_retryable(error: Exception) -> bool:
+    """
+    Timeouts, connection errors, 429s and 5xx responses are worth retrying;
+    other HTTP errors and invalid payloads are not.
+    """
+    if isinstance(error, aiohttp.ClientResponseError):
+        return error.status == 429 or error.status >= 500
+    return isinstance(error, (aiohttp.ClientError, asyncio.TimeoutError))
+
+
+async def _aget_concepts_page(**params) -> MedicalConceptsResponse:
+    """
+    Fetches one Athena page, bounded by the Athena semaphore and retried with
+    exponential backoff and jitter on transient failures.
+    """
+    for attempt in range(1, ATHENA_MAX_ATTEMPTS + 1):
+        try:
+            async with _athena_semaphore():
+                return await _get_async_athena().get_medical_concepts(
+                    **params)
+        except Exception as e:
+            if attempt == ATHENA_MAX_ATTEMPTS or not _is_retryable(e):
+                raise
+            delay = min(8.0, 0.5 * 2**(attempt - 1)) * random.uniform(0.5, 1)
+            logger.warning("Athena call failed (%s), retrying in %.1fs", e,
+                           delay)
+            await asyncio.sleep(delay)
+
+
+# Athena content changes rarely. Searches that come back empty are cached like
+# any other; failed ones only for ATHENA_ERROR_TTL.
+@cached(ttl=24 * 3600, persist=True, error_ttl=ATHENA_ERROR_TTL)
+async def _afetch_concepts(
+        query: str,
+        page_size: int = ATHENA_PAGE_SIZE) -> MedicalConceptsResponse:
+    response = await _aget_concepts_page(query=query, page_size=page_size)
+    last_page = min(response.totalPages or 1, ATHENA_MAX_PAGES)
+    if last_page > 1:
+        pages = await asyncio.gather(
+            *(_aget_concepts_page(query=query, page=page, page_size=page_size)
+              for page in range(2, last_page + 1)))
+        # Merge in page order, dropping concepts repeated across pages
+        concepts = {
+            concept.id: concept
+            for page in (response, *pages) for concept in page.content
+        }
+        response = response.model_copy(
+            update={"content": list(concepts.values())})
+    return response
+
+
+async def afind_omop_concept(
+    chosen_term: str,
+    language: str = "en",
+    synonyms: Optional[List[str]] = None,
+    max_rows: Optional[int] = None,
+    page_size: int = ATHENA_PAGE_SIZE,
+) -> str:
+    """
+    Async counterpart of find_omop_concept, using the aiohttp Athena client.
+    """
+    try:
+        query = _build_concept_query(chosen_term, synonyms)
+        logger.debug("Constructed query: %s", query)
+        return _concepts_to_json(await _afetch_concepts(query, page_size),
+                                 chosen_term, max_rows)
+    except Exception as e:
+        logger.exception("Error calling Athena API: %s", e)
+        return _error_json(str(e))
+
+
+def _normalize_term(term: str) -> str:
+    """
+    Normalises a term as echoed back by an LMP: case, surrounding whitespace
+    and quotes are ignored.
+    """
+    return term.strip().strip('"\'').casefold()
+
+
+def _same_term(a: str, b: str) -> bool:
+    """
+    Compares two terms ignoring case, surrounding whitespace and the quotes
+    the translate prompt sometimes wraps its answer in.
+    """
+    return _normalize_term(a) == _normalize_term(b)
+
+
+def _names_concept(concepts_json: str, term: str) -> bool:
+    """
+    True if one of the concepts in a search payload is named exactly term
+    (ignoring case, whitespace and quotes).
+    """
+    if not concepts_json.startswith('{"concepts":'):
+        return False
+    return any(
+        _same_term(concept.get("name", ""), term)
+        for concept in orjson.loads(concepts_json)["concepts"])
+
+
+def _discard_result(task: asyncio.Future) -> None:
+    """
+    Done callback for tasks nobody awaits: retrieves the exception, if any,
+    so it isn't reported as never retrieved.
+    """
+    if not task.cancelled():
+        task.exception()
+
+
+class _AthenaSearchError(Exception):
+    """
+    An Athena search failed. Raised out of the cached concept lookup so the
+    failure isn't stored as an empty result for the whole cache ttl.
+    """
+
+
+async def _asearch_concepts(term: str) -> MedicalConceptsResponse:
+    """
+    Searches Athena for a term, raising _AthenaSearchError if it fails.
+    """
+    try:
+        return await _afetch_concepts(_build_concept_query(term))
+    except Exception as e:
+        raise _AthenaSearchError(str(e)) from e
+
+
+@cached(ttl=3600, casefold=("language", "context"))
+async def _aconcept_lookup(term: str, context: str,
+                           language: str) -> ConceptResponse:
+    """
+    aconcept_lookup without the handling of Athena failures, which it raises
+    as _AthenaSearchError.
+    """
+    if _is_english(language):
+        response = await _asearch_concepts(term)
+        return ConceptResponse(concepts=_table_rows(
+            _top_concepts(response.content, term, CONCEPT_LOOKUP_MAX_ROWS)))
+
+    translation = asyncio.ensure_future(atranslate(term, context, "english"))
+    # Also retrieves the translation's error if the search below fails first
+    translation.add_done_callback(_discard_result)
+    concepts_json = _concepts_to_json(await _asearch_concepts(term), term,
+                                      CONCEPT_LOOKUP_MAX_ROWS)
+    # Athena's vocabulary is English, so an exact concept name match means the
+    # term needs no translation. The translation then finishes in the
+    # background and is cached.
+    if not _names_concept(concepts_json, term):
+        string_to_search = await translation
+        if not _same_term(string_to_search, term):
+            concepts_json = _concepts_to_json(
+                await _asearch_concepts(string_to_search), string_to_search,
+                CONCEPT_LOOKUP_MAX_ROWS)
+    if not _has_concepts(concepts_json):
+        return ConceptResponse(concepts=[])
+    return await _acomplete(_concept_lookup_messages(concepts_json, language),
+                            **concept_lookup.__ell_api_params__)
+
+
+async def aconcept_lookup(term: str,
+                          context: str,
+                          language: str = "en") -> ConceptResponse:
+    """
+    Async counterpart of concept_lookup.
+    The Athena search for the untranslated term runs while the term is being
+    translated. If it finds a concept named exactly like the term, the term
+    is already English and the lookup goes ahead without waiting for the
+    translation; likewise if the translation turns out to be the same term.
+    English requests need neither translation nor the formatting LMP: Athena
+    already returns the rows in English, so no LLM call is made at all. Nor
+    is the LMP called when the search found nothing.
+    A failed Athena search gives an empty response, like the LMP does for an
+    error payload, but is not cached: the next call searches again.
+    """
+    try:
+        return await _aconcept_lookup(term, context, language)
+    except _AthenaSearchError as e:
+        logger.error("Error calling Athena API: %s", e)
+        return ConceptResponse(concepts=[])
+
+
+async def batch_concept_lookup(terms: List[str],
+                               context: str,
+                               language: str = "en") -> List[ConceptResponse]:
+    """
+    Runs aconcept_lookup for many terms concurrently; outbound calls stay
+    bounded by the OpenAI and Athena semaphores.
+    Returns the responses in the same order as terms.
+    """
+    return list(await asyncio.gather(
+        *(aconcept_lookup(term, context, language) for term in terms)))
+
+
+def run_concept_lookups(terms: List[str],
+                        context: str,
+                        language: str = "en") -> List[ConceptResponse]:
+    """
+    Blocking entry point to batch_concept_lookup for callers without an
+    event loop (scripts, notebooks). Runs the lookups concurrently on a fresh
+    loop and closes the shared clients before it is torn down.
+    """
+
+    async def run():
+        try:
+            return await batch_concept_lookup(terms, context, language)
+        finally:
+            await aclose_clients()
+
+    return asyncio.run(run())
+
+
+async def aconcept_lookup_stream(term: str,
+                                 context: str,
+                                 language: str = "en"
+                                 ) -> AsyncIterator[ConceptTableRow]:
+    """
+    Yields the Athena concepts for a term as soon as the search returns,
+    without waiting for the concept lookup LMP to translate them. Rows are in
+    Athena's (English) wording; aconcept_lookup gives the translated table.
+    Search errors are raised rather than returned as error JSON.
+    """
+    string_to_search = term if _is_english(language) else await atranslate(
+        term, context, "english")
+    response = await _afetch_concepts(_build_concept_query(string_to_search))
+    for row in _table_rows(response.content):
+        yield row
+
+
+class LookupBundle(BaseModel):
+    synonyms: Optional[SynonymResponse] = None
+    disambiguation: Optional[str] = None
+    translated_term: str
+    concepts_json: str
+
+
+async def alookup_bundle(term: str, language: str,
+                         context: str) -> LookupBundle:
+    """
+    Runs synonym generation, disambiguation and translation of a term
+    concurrently, then searches Athena with the translated term and its
+    synonyms. A failing LLM call leaves its field empty instead of failing the
+    whole bundle.
+    """
+    synonyms, disambiguation, translated = await asyncio.gather(
+        agenerate_synonyms(term, language, context),
+        adisambiguate(term, language),
+        atranslate(term, context, "english"),
+        return_exceptions=True)
+    for name, result in (("synonyms", synonyms),
+                         ("disambiguation", disambiguation),
+                         ("translation", translated)):
+        if isinstance(result, Exception):
+            logger.error("Lookup bundle %s call failed: %s", name, result)
+    if isinstance(synonyms, Exception):
+        synonyms = None
+    if isinstance(disambiguation, Exception):
+        disambiguation = None
+    if isinstance(translated, Exception):
+        translated = term
+
+    concepts_json = await afind_omop_concept(
+        translated,
+        language,
+        synonyms=[s.synonym for s in synonyms.synonyms] if synonyms else None)
+    return LookupBundle(synonyms=synonyms,
+                        disambiguation=disambiguation,
+                        translated_term=translated,
+                        concepts_json=concepts_json)
+
+
+async def aexpanded_lookup(term: str, language: str, context: str) -> str:
+    """
+    Searches Athena for each generated synonym of a term in parallel and merges
+    the hits. Concepts are deduplicated by id and ranked by the summed
+    relevance of the synonyms that found them. Returns the same JSON string as
+    afind_omop_concept.
+    """
+    synonyms = (await agenerate_synonyms(term, language, context)).synonyms
+    results = await asyncio.gather(
+        *(_afetch_concepts(synonym.synonym) for synonym in synonyms),
+        return_exceptions=True)
+
+    scores = {}
+    concepts = {}
+    for synonym, result in zip(synonyms, results, strict=True):
+        if isinstance(result, Exception):
+            logger.error("Athena search for synonym %r failed: %s",
+                         synonym.synonym, result)
+            continue
+        for concept in result.content:
+            concepts.setdefault(concept.id, concept)
+            scores[concept.id] = scores.get(concept.id, 0.0) + synonym.relevance
+    if not concepts:
+        return _EMPTY_RESULT
+
+    ranked = sorted(concepts.values(),
+                    key=lambda concept: scores[concept.id],
+                    reverse=True)
+    # The concepts were validated when fetched, so skip validating them again
+    return _concepts_to_json(
+        MedicalConceptsResponse.model_construct(size=len(ranked),
+                                                number=0,
+                                                numberOfElements=len(ranked),
+                                                empty=False,
+                                                content=ranked))